@@ -7,30 +7,54 @@ interaction with the fashion analysis process.
 """
 
 import asyncio
-import json
+import hashlib
+import logging
+import logging.handlers
 import os
+import queue
 import tempfile
 import uuid
-from datetime import datetime
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import traceback
+from typing import Deque, Dict, List, Optional, Set, Any
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, File, UploadFile, WebSocket, WebSocketDisconnect, HTTPException
+import orjson
+from fastapi import Body, FastAPI, File, Request, UploadFile, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from pydantic import BaseModel
 
 # Import our modular workflow components
 from core.workflow_manager import ZavaConceptWorkflowManager
 
+logger = logging.getLogger("zava")
+
+# Upper bounds on retained status history; older entries are dropped first
+MAX_STATUS_STEPS = 100
+MAX_STATUS_OUTPUTS = 500
+
+# orjson options for all WebSocket payloads; timestamps are stored as UTC datetimes
+# and formatted by orjson as RFC 3339 with a trailing "Z"
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+# High-frequency delta messages are coalesced and flushed at most this often (seconds)
+COALESCED_MESSAGE_TYPES = frozenset({"progress_update", "output_added", "output_delta"})
+BROADCAST_COALESCE_DELAY = 0.05
+
+# Chunk size used when streaming uploaded pitch decks to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class ConceptAnalysisStatus(BaseModel):
     """
     Data model representing the current status of a clothing concept analysis.
 
     This model tracks the progress, current step, and results of the
-    fashion analysis workflow for real-time UI updates.
+    fashion analysis workflow for real-time UI updates. It documents the
+    response schema of the status endpoint; live state is held in AnalysisState.
     """
 
     status: str  # ready, running, waiting_approval, completed, error
@@ -42,16 +66,62 @@ class ConceptAnalysisStatus(BaseModel):
     error: Optional[str] = None  # Error message if status is 'error'
 
 
-class ConceptApprovalDecision(BaseModel):
+@dataclass(slots=True)
+class AnalysisState:
+    """
+    Mutable state of the current clothing concept analysis.
+
+    Stored on app.state and updated with plain attribute stores. Call dirty()
+    after any mutation so the cached JSON snapshot is rebuilt on next use.
+    """
+
+    status: str = "ready"  # ready, running, waiting_approval, completed, error
+    progress: int = 0  # 0-100 percentage of completion
+    current_step: str = "Ready to analyze clothing concepts"  # Current workflow step description
+    # History of completed steps (bounded)
+    steps: Deque[Dict[str, Any]] = field(default_factory=lambda: deque(maxlen=MAX_STATUS_STEPS))
+    # Analysis outputs and logs (bounded)
+    outputs: Deque[Dict[str, Any]] = field(default_factory=lambda: deque(maxlen=MAX_STATUS_OUTPUTS))
+    approval_request: Optional[Dict[str, Any]] = None  # Pending approval request
+    error: Optional[str] = None  # Error message if status is 'error'
+
+    # Serialized snapshot, reused across broadcasts until the state changes.
+    # orjson skips underscore-prefixed dataclass fields, so it never serializes itself.
+    _cached_json: Optional[bytes] = field(default=None, repr=False, compare=False)
+
+    def dirty(self) -> None:
+        """Invalidate the cached snapshot after any field or history mutation."""
+        self._cached_json = None
+
+    def get_dump_json(self) -> bytes:
+        """
+        Return the state as JSON, re-serialized only after a mutation.
+
+        Returns:
+            bytes: Cached orjson output for splicing into WebSocket messages
+        """
+        if self._cached_json is None:
+            self._cached_json = orjson.dumps(self, default=list, option=ORJSON_OPTIONS)
+        return self._cached_json
+
+
+# Accepted values for ConceptApprovalDecision.decision (compared case-insensitively),
+# mapped to whether they approve the concept
+APPROVAL_DECISIONS = {"yes": True, "approve": True, "no": False, "reject": False}
+
+
+@dataclass(slots=True)
+class ConceptApprovalDecision:
     """
     Data model for human approval decisions on clothing concepts.
 
     Captures the decision (approve/reject) and any additional feedback
-    from Zava's design team.
+    from Zava's design team. Validated by hand in the endpoint since the
+    payload is two plain strings.
     """
 
     decision: str  # "yes" to approve, "no" to reject
-    feedback: Optional[str] = ""  # Optional feedback or comments
+    feedback: str = ""  # Optional feedback or comments
 
 
 class ZavaWebSocketManager:
@@ -64,9 +134,13 @@ class ZavaWebSocketManager:
 
     def __init__(self):
         """Initialize the WebSocket connection manager."""
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.connection_count = 0
 
+        # Delta messages waiting for the next coalesced flush
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
     async def connect(self, websocket: WebSocket) -> None:
         """
         Accept and register a new WebSocket connection.
@@ -75,87 +149,212 @@ class ZavaWebSocketManager:
             websocket: The WebSocket connection to register
         """
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
         self.connection_count += 1
-        print(f"WebSocket connected (Total: {self.connection_count})")
+        logger.info("WebSocket connected (Total: %d)", self.connection_count)
 
     def disconnect(self, websocket: WebSocket) -> None:
         """
-        Remove a WebSocket connection from the active list.
+        Remove a WebSocket connection from the active set.
 
         Args:
             websocket: The WebSocket connection to remove
         """
         if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-            print(f"WebSocket disconnected (Remaining: {len(self.active_connections)})")
+            self.active_connections.discard(websocket)
+            logger.info("WebSocket disconnected (Remaining: %d)", len(self.active_connections))
 
     async def broadcast_message(self, message: dict) -> None:
         """
         Send a message to all connected WebSocket clients.
 
-        This method handles connection errors gracefully by removing
-        disconnected clients from the active list.
+        Progress and output deltas are queued and sent together as a single
+        "batch" message after BROADCAST_COALESCE_DELAY; all other messages are
+        sent immediately, after any queued deltas.
 
         Args:
             message: Dictionary to send as JSON to all clients
         """
-        disconnected = []
+        if message.get("type") in COALESCED_MESSAGE_TYPES:
+            self.queue_message(message)
+            return
 
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(json.dumps(message))
-            except Exception as e:
-                print(f"WARNING: WebSocket send error: {e}")
-                disconnected.append(connection)
+        # Serialize once for all clients; orjson handles datetime values natively
+        await self.broadcast_json(orjson.dumps(message, option=ORJSON_OPTIONS))
+
+    def queue_message(self, message: dict) -> None:
+        """
+        Queue a delta message for the next coalesced flush without awaiting.
+
+        Must be called from the event loop thread; the flush is scheduled as a task.
+
+        Args:
+            message: Dictionary to send as JSON to all clients
+        """
+        self._pending.append(message)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_delay())
+
+    async def broadcast_json(self, payload: bytes) -> None:
+        """
+        Send an already-serialized JSON message to all connected WebSocket clients.
+
+        Queued deltas are flushed first so clients never receive a delta after
+        a status snapshot that already contains it.
+
+        Args:
+            payload: UTF-8 JSON bytes to send to all clients
+        """
+        await self.flush_pending()
+        await self._send_to_all(payload)
+
+    async def flush_pending(self) -> None:
+        """Send all queued delta messages now as one batch message."""
+        # Cancel a still-sleeping timer so the next queued delta starts a single new one
+        flush_task, self._flush_task = self._flush_task, None
+        if flush_task is not None and flush_task is not asyncio.current_task():
+            flush_task.cancel()
+        if not self._pending:
+            return
+
+        messages, self._pending = self._pending, []
+        if len(messages) == 1:
+            payload = orjson.dumps(messages[0], option=ORJSON_OPTIONS)
+        else:
+            payload = orjson.dumps({"type": "batch", "messages": messages}, option=ORJSON_OPTIONS)
+        await self._send_to_all(payload)
+
+    async def _flush_after_delay(self) -> None:
+        """Flush queued delta messages once the coalescing window has elapsed."""
+        await asyncio.sleep(BROADCAST_COALESCE_DELAY)
+        await self.flush_pending()
+
+    async def _send_to_all(self, payload: bytes) -> None:
+        """
+        Send serialized JSON to every connected client and drop failed connections.
+
+        Payloads go out as binary frames so orjson's bytes never need decoding.
+
+        Args:
+            payload: UTF-8 JSON bytes to send to all clients
+        """
+        # Snapshot connections so disconnects during the sends can't mutate the set
+        connections = tuple(self.active_connections)
+
+        # Send to all clients concurrently instead of one round-trip at a time
+        results = await asyncio.gather(
+            *(connection.send_bytes(payload) for connection in connections),
+            return_exceptions=True
+        )
+
+        failed = [connection for connection, result in zip(connections, results) if isinstance(result, Exception)]
+        if failed:
+            # Drop failed clients in one set operation; clients that connected while
+            # the sends were in flight are not in the snapshot and stay registered
+            self.active_connections.difference_update(failed)
+            logger.warning(
+                "Dropped %d WebSocket connection(s) after send errors (Remaining: %d)",
+                len(failed), len(self.active_connections)
+            )
+
+
+# Prebuilt envelope for plain status snapshots, the most frequent status message
+_STATUS_UPDATE_PREFIX = b'{"type":"status_update","status":'
+_STATUS_UPDATE_SUFFIX = b'}'
+
+
+def build_status_update() -> bytes:
+    """
+    Build a status_update message by splicing the cached status JSON into a fixed envelope.
+
+    Returns:
+        bytes: JSON of the status_update message
+    """
+    return _STATUS_UPDATE_PREFIX + app.state.analysis.get_dump_json() + _STATUS_UPDATE_SUFFIX
+
+
+def build_status_message(message: Dict[str, Any]) -> bytes:
+    """
+    Serialize a WebSocket message with the current analysis status spliced in.
+
+    The status snapshot is serialized once per state change and cached, so only
+    the small message envelope is encoded per event.
+
+    Args:
+        message: Message fields to send alongside the status (must include "type")
+
+    Returns:
+        bytes: JSON of the message with a "status" field appended
+    """
+    envelope = orjson.dumps(message, option=ORJSON_OPTIONS)
+    return envelope[:-1] + b',"status":' + app.state.analysis.get_dump_json() + b'}'
 
-        # Clean up disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Load static UI assets once at startup so requests are served from memory.
+
+    Args:
+        app: The FastAPI application being started
+    """
+    try:
+        app.state.index_html = Path("static/index.html").read_bytes()
+        app.state.index_html_etag = f'"{hashlib.sha1(app.state.index_html).hexdigest()}"'
+    except FileNotFoundError:
+        app.state.index_html = None
+        app.state.index_html_etag = None
+    yield
 
 
 # Initialize FastAPI application
 app = FastAPI(
     title="Zava Clothing Concept Analyzer",
     description="Fashion concept evaluation system for Zava clothing company",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson serializes plain dict responses directly instead of json.dumps
+    default_response_class=ORJSONResponse
 )
 
-# Global application state
+# Application state
 websocket_manager = ZavaWebSocketManager()
-workflow_manager: Optional[ZavaConceptWorkflowManager] = None
-current_analysis_status = ConceptAnalysisStatus(
-    status="ready",
-    progress=0,
-    current_step="Ready to analyze clothing concepts",
-    steps=[],
-    outputs=[],
-    approval_request=None
-)
+app.state.analysis = AnalysisState()
+app.state.workflow_manager = None
 # Track original filenames for temp files
-original_filenames: Dict[str, str] = {}
+app.state.original_filenames = {}
+# Map upload IDs handed to the client to temp file paths
+app.state.uploads = {}
 
 # Mount static files for the UI
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
 @app.get("/", response_class=HTMLResponse)
-async def serve_main_ui():
+async def serve_main_ui(request: Request):
     """
     Serve the main Zava concept analysis UI.
 
+    The page is served from bytes cached at startup with an ETag, so browsers
+    revalidate with a cheap 304 instead of re-downloading it.
+
+    Args:
+        request: Incoming request, checked for If-None-Match
+
     Returns:
-        HTMLResponse: The main application interface
+        Response: The main application interface, or 304 if unchanged
     """
-    try:
-        with open("static/index.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
+    if app.state.index_html is None:
         return HTMLResponse(
             content="<h1>Zava UI Not Found</h1><p>Please ensure static/index.html exists.</p>",
             status_code=404
         )
 
+    headers = {"ETag": app.state.index_html_etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == app.state.index_html_etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=app.state.index_html, media_type="text/html", headers=headers)
+
 
 @app.post("/upload-concept")
 async def upload_clothing_concept(file: UploadFile = File(...)):
@@ -174,7 +373,7 @@ async def upload_clothing_concept(file: UploadFile = File(...)):
     Raises:
         HTTPException: If file format is invalid or upload fails
     """
-    global current_analysis_status
+    analysis = app.state.analysis
 
     try:
         # Validate file format
@@ -184,44 +383,48 @@ async def upload_clothing_concept(file: UploadFile = File(...)):
                 detail="Only .pptx PowerPoint files are supported for concept submissions"
             )
 
-        # Save uploaded file to temporary location
+        # Stream uploaded file to temporary location in chunks
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pptx") as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                tmp_file.write(chunk)
+            file_size = tmp_file.tell()
             temp_file_path = tmp_file.name
 
         # Store the original filename for later use
-        original_filenames[temp_file_path] = file.filename
+        app.state.original_filenames[temp_file_path] = file.filename
+
+        # Hand the client an opaque upload ID rather than the server-side path
+        upload_id = uuid.uuid4().hex
+        app.state.uploads[upload_id] = temp_file_path
 
         # Update analysis status
-        current_analysis_status.status = "concept_uploaded"
-        current_analysis_status.current_step = f"Clothing concept uploaded: {file.filename}"
+        analysis.status = "concept_uploaded"
+        analysis.current_step = f"Clothing concept uploaded: {file.filename}"
+        analysis.dirty()
 
         # Log the upload
-        await add_analysis_output(
+        add_analysis_output(
             source="Upload",
             content=f"Concept file '{file.filename}' uploaded successfully",
             output_type="info"
         )
 
         # Broadcast update to connected clients
-        await websocket_manager.broadcast_message({
-            "type": "status_update",
-            "status": current_analysis_status.model_dump()
-        })
+        await websocket_manager.broadcast_json(build_status_update())
 
         return {
             "message": "Clothing concept uploaded successfully",
             "filename": file.filename,
-            "temp_path": temp_file_path,
-            "file_size": len(content)
+            "upload_id": upload_id,
+            "file_size": file_size
         }
 
     except Exception as e:
         # Handle upload errors
         error_msg = f"Failed to upload clothing concept: {str(e)}"
-        current_analysis_status.status = "error"
-        current_analysis_status.error = error_msg
+        analysis.status = "error"
+        analysis.error = error_msg
+        analysis.dirty()
 
         await websocket_manager.broadcast_message({
             "type": "error",
@@ -231,8 +434,8 @@ async def upload_clothing_concept(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=error_msg)
 
 
-@app.post("/start-analysis/{temp_path}")
-async def start_concept_analysis(temp_path: str):
+@app.post("/start-analysis/{upload_id}")
+async def start_concept_analysis(upload_id: str):
     """
     Start the comprehensive fashion analysis workflow for an uploaded concept.
 
@@ -240,55 +443,63 @@ async def start_concept_analysis(temp_path: str):
     market research, design evaluation, and production assessment.
 
     Args:
-        temp_path: Path to the temporarily stored concept file
+        upload_id: Upload ID returned by /upload-concept for the concept file
 
     Returns:
         Dict confirming analysis startup
 
     Raises:
-        HTTPException: If workflow is already running or startup fails
+        HTTPException: If the upload ID is unknown, workflow is already running or startup fails
     """
-    global workflow_manager, current_analysis_status
+    analysis = app.state.analysis
+
+    # Resolve the upload ID to the temporarily stored concept file
+    temp_path = app.state.uploads.get(upload_id)
+    if temp_path is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Unknown concept upload. Please upload the concept file again."
+        )
 
     try:
-        if current_analysis_status.status == "running":
+        if analysis.status == "running":
             raise HTTPException(
                 status_code=400,
                 detail="Fashion analysis already in progress"
             )
 
         # Initialize the workflow manager with callback functions
-        workflow_manager = ZavaConceptWorkflowManager(
+        app.state.workflow_manager = ZavaConceptWorkflowManager(
             progress_callback=update_analysis_progress,
             output_callback=add_analysis_output,
             approval_callback=request_team_approval,
-            error_callback=handle_workflow_error
+            error_callback=handle_workflow_error,
+            stream_callback=stream_analysis_output
         )
 
         # Reset analysis state
-        current_analysis_status.status = "running"
-        current_analysis_status.progress = 0
-        current_analysis_status.current_step = "Initializing fashion analysis workflow..."
-        current_analysis_status.steps = []
-        current_analysis_status.outputs = []
-        current_analysis_status.error = None
-        current_analysis_status.approval_request = None
+        analysis.status = "running"
+        analysis.progress = 0
+        analysis.current_step = "Initializing fashion analysis workflow..."
+        analysis.steps.clear()
+        analysis.outputs.clear()
+        analysis.error = None
+        analysis.approval_request = None
+        analysis.dirty()
 
         # Broadcast status update
-        await websocket_manager.broadcast_message({
-            "type": "status_update",
-            "status": current_analysis_status.model_dump()
-        })
+        await websocket_manager.broadcast_json(build_status_update())
 
         # Start the analysis workflow in the background
-        asyncio.create_task(execute_concept_analysis_async(temp_path))
+        asyncio.create_task(execute_concept_analysis_async(upload_id, temp_path))
 
         return {"message": "Zava fashion analysis workflow started successfully"}
 
     except Exception as e:
         error_msg = f"Failed to start concept analysis: {str(e)}"
-        current_analysis_status.status = "error"
-        current_analysis_status.error = error_msg
+        analysis.status = "error"
+        analysis.error = error_msg
+        analysis.dirty()
 
         await websocket_manager.broadcast_message({
             "type": "error",
@@ -299,7 +510,7 @@ async def start_concept_analysis(temp_path: str):
 
 
 @app.post("/submit-approval")
-async def submit_team_approval(approval: ConceptApprovalDecision):
+async def submit_team_approval(body: Dict[str, Any] = Body(...)):
     """
     Submit Zava team's approval decision for a clothing concept.
 
@@ -307,15 +518,28 @@ async def submit_team_approval(approval: ConceptApprovalDecision):
     the workflow based on the team's evaluation.
 
     Args:
-        approval: The team's decision (approve/reject) with optional feedback
+        body: JSON object with the team's decision (approve/reject) and optional feedback
 
     Returns:
         Dict confirming approval submission
 
     Raises:
-        HTTPException: If no active workflow or not waiting for approval
+        HTTPException: If the decision or feedback is invalid, no workflow is active, or it is not waiting for approval
     """
-    global workflow_manager, current_analysis_status
+    decision = body.get("decision")
+    approved = APPROVAL_DECISIONS.get(decision.lower()) if isinstance(decision, str) else None
+    if approved is None:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Decision must be one of: {', '.join(sorted(APPROVAL_DECISIONS))}"
+        )
+    feedback = body.get("feedback")
+    if feedback is not None and not isinstance(feedback, str):
+        raise HTTPException(status_code=422, detail="Feedback must be a string")
+    approval = ConceptApprovalDecision(decision=decision, feedback=feedback or "")
+
+    analysis = app.state.analysis
+    workflow_manager = app.state.workflow_manager
 
     try:
         if not workflow_manager:
@@ -324,7 +548,7 @@ async def submit_team_approval(approval: ConceptApprovalDecision):
                 detail="No active concept analysis workflow"
             )
 
-        if current_analysis_status.status != "waiting_approval":
+        if analysis.status != "waiting_approval":
             raise HTTPException(
                 status_code=400,
                 detail="Workflow not waiting for team approval"
@@ -334,23 +558,21 @@ async def submit_team_approval(approval: ConceptApprovalDecision):
         await workflow_manager.send_approval_decision(approval.decision, approval.feedback)
 
         # Update status to reflect decision processing
-        current_analysis_status.status = "running"
-        current_analysis_status.approval_request = None
-        current_analysis_status.current_step = f"Processing team decision: {approval.decision.upper()}"
+        analysis.status = "running"
+        analysis.approval_request = None
+        analysis.current_step = f"Processing team decision: {approval.decision.upper()}"
+        analysis.dirty()
 
         # Log the decision
-        decision_text = "APPROVED" if approval.decision.lower() in ['yes', 'approve'] else "REJECTED"
-        await add_analysis_output(
+        decision_text = "APPROVED" if approved else "REJECTED"
+        add_analysis_output(
             source="Zava Team",
-            content=f"Concept {decision_text}" + (f" - {approval.feedback}" if approval.feedback else ""),
+            content=f"Concept {decision_text} - {approval.feedback}" if approval.feedback else f"Concept {decision_text}",
             output_type="decision"
         )
 
         # Broadcast status update
-        await websocket_manager.broadcast_message({
-            "type": "status_update",
-            "status": current_analysis_status.model_dump()
-        })
+        await websocket_manager.broadcast_json(build_status_update())
 
         return {"message": f"Team approval submitted: {decision_text}"}
 
@@ -363,15 +585,18 @@ async def submit_team_approval(approval: ConceptApprovalDecision):
         raise HTTPException(status_code=500, detail=error_msg)
 
 
-@app.get("/analysis-status")
+@app.get("/analysis-status", response_model=ConceptAnalysisStatus)
 async def get_analysis_status():
     """
     Get the current status of the clothing concept analysis workflow.
 
+    Serves the cached status JSON that WebSocket broadcasts already use, so
+    the response skips model construction and FastAPI's encoder entirely.
+
     Returns:
-        Dict: Current analysis status including progress and outputs
+        Response: Current analysis status including progress and outputs
     """
-    return current_analysis_status.model_dump()
+    return Response(content=app.state.analysis.get_dump_json(), media_type="application/json")
 
 
 @app.websocket("/ws")
@@ -389,11 +614,10 @@ async def websocket_endpoint(websocket: WebSocket):
     await websocket_manager.connect(websocket)
 
     try:
-        # Send current status immediately upon connection
-        await websocket.send_text(json.dumps({
-            "type": "status_update",
-            "status": current_analysis_status.model_dump()
-        }))
+        # Send current status immediately upon connection, after any queued
+        # deltas so none of them arrive again on top of the snapshot
+        await websocket_manager.flush_pending()
+        await websocket.send_bytes(build_status_update())
 
         # Keep connection alive and handle any incoming messages
         while True:
@@ -411,19 +635,19 @@ async def websocket_endpoint(websocket: WebSocket):
 
 # Workflow callback functions for UI integration
 
-async def update_analysis_progress(step: str, progress: int, step_data: Dict[str, Any] = None):
+def update_analysis_progress(step: str, progress: int, step_data: Dict[str, Any] = None):
     """
-    Update the analysis progress and notify connected clients.
+    Update the analysis progress and queue a delta for connected clients.
 
     Args:
         step: Current step name/description
         progress: Progress percentage (0-100)
         step_data: Additional step information and metadata
     """
-    global current_analysis_status
+    analysis = app.state.analysis
 
-    current_analysis_status.current_step = step
-    current_analysis_status.progress = progress
+    analysis.current_step = step
+    analysis.progress = progress
 
     # Add step information to history
     completed_steps = []
@@ -433,7 +657,7 @@ async def update_analysis_progress(step: str, progress: int, step_data: Dict[str
     step_info = {
         "name": step,
         "progress": progress,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(timezone.utc),
         "completed_steps": completed_steps
     }
 
@@ -441,43 +665,60 @@ async def update_analysis_progress(step: str, progress: int, step_data: Dict[str
     if step_data:
         step_info.update({k: v for k, v in step_data.items() if k != "completed_steps"})
 
-    current_analysis_status.steps.append(step_info)
+    analysis.steps.append(step_info)
+    analysis.dirty()
 
-    # Broadcast progress update
-    await websocket_manager.broadcast_message({
+    # Queue only the new step for the coalesced flush; clients append it to their
+    # local history and read the current step name and progress from it
+    websocket_manager.queue_message({
         "type": "progress_update",
-        "step": step,
-        "progress": progress,
-        "completed_steps": completed_steps,
-        "status": current_analysis_status.model_dump()
+        "step_info": step_info
     })
 
 
-async def add_analysis_output(source: str, content: str, output_type: str = "text"):
+def add_analysis_output(source: str, content: str, output_type: str = "text"):
     """
-    Add analysis output/result and notify connected clients.
+    Add analysis output/result and queue a delta for connected clients.
 
     Args:
         source: Source of the output (e.g., "Market Agent", "Design Agent")
         content: Output content/message
         output_type: Type of output (text, info, warning, error, success, decision)
     """
-    global current_analysis_status
+    analysis = app.state.analysis
 
     output = {
         "source": source,
         "content": content,
         "type": output_type,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now(timezone.utc)
     }
 
-    current_analysis_status.outputs.append(output)
+    analysis.outputs.append(output)
+    analysis.dirty()
 
-    # Broadcast new output
-    await websocket_manager.broadcast_message({
+    # Queue only the new output for the coalesced flush; clients append it to their local history
+    websocket_manager.queue_message({
         "type": "output_added",
-        "output": output,
-        "status": current_analysis_status.model_dump()
+        "output": output
+    })
+
+
+def stream_analysis_output(source: str, delta: str):
+    """
+    Queue a chunk of streamed agent text for connected clients.
+
+    Streamed text is a live preview only; it is not kept in the analysis
+    state, and the finished result arrives through the normal outputs.
+
+    Args:
+        source: Workflow step producing the text (e.g., "Create Executive Report")
+        delta: Newly generated text
+    """
+    websocket_manager.queue_message({
+        "type": "output_delta",
+        "source": source,
+        "delta": delta
     })
 
 
@@ -489,22 +730,22 @@ async def request_team_approval(question: str, context: str):
         question: The approval question to present
         context: Additional context for the decision
     """
-    global current_analysis_status
+    analysis = app.state.analysis
 
-    current_analysis_status.status = "waiting_approval"
-    current_analysis_status.approval_request = {
+    analysis.status = "waiting_approval"
+    analysis.approval_request = {
         "question": question,
         "context": context,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now(timezone.utc)
     }
+    analysis.dirty()
 
     # Broadcast approval request
-    await websocket_manager.broadcast_message({
+    await websocket_manager.broadcast_json(build_status_message({
         "type": "approval_request",
         "question": question,
-        "context": context,
-        "status": current_analysis_status.model_dump()
-    })
+        "context": context
+    }))
 
 
 async def handle_workflow_error(error: str):
@@ -514,106 +755,139 @@ async def handle_workflow_error(error: str):
     Args:
         error: Error message to display
     """
-    global current_analysis_status
+    analysis = app.state.analysis
 
-    current_analysis_status.status = "error"
-    current_analysis_status.error = error
+    analysis.status = "error"
+    analysis.error = error
+    analysis.dirty()
 
-    await websocket_manager.broadcast_message({
+    await websocket_manager.broadcast_json(build_status_message({
         "type": "error",
-        "error": error,
-        "status": current_analysis_status.model_dump()
-    })
+        "error": error
+    }))
 
 
-async def execute_concept_analysis_async(concept_file_path: str):
+async def execute_concept_analysis_async(upload_id: str, concept_file_path: str):
     """
     Execute the complete concept analysis workflow asynchronously.
 
     This function runs the full fashion analysis pipeline and handles
     the final results, including generating reports and updating UI.
+    The upload is released and its temp file deleted once the run ends,
+    whether it succeeded or failed.
 
     Args:
+        upload_id: Upload ID the concept file was registered under
         concept_file_path: Path to the concept file to analyze
     """
-    global current_analysis_status, workflow_manager, original_filenames
+    analysis = app.state.analysis
+    workflow_manager = app.state.workflow_manager
 
     try:
         # Get the original filename for this temp file
-        original_filename = original_filenames.get(concept_file_path, "Unknown_Concept.pptx")
+        original_filename = app.state.original_filenames.get(concept_file_path, "Unknown_Concept.pptx")
 
         # Run the complete concept analysis workflow
         result = await workflow_manager.analyze_clothing_concept(concept_file_path, original_filename)
 
         # Update final status
-        current_analysis_status.status = "completed"
-        current_analysis_status.progress = 100
-        current_analysis_status.current_step = f"Analysis completed: {result}"
+        analysis.status = "completed"
+        analysis.progress = 100
+        analysis.current_step = f"Analysis completed: {result}"
+        analysis.dirty()
 
         # Try to read generated report files for display
         final_document = None
         filename = None
 
         try:
-            import glob
-
-            # Look for generated reports based on result
-            if result == "APPROVED":
-                # Look for approved concept reports
-                approved_files = glob.glob("zava_approved_concept_*.md")
-                if approved_files:
-                    latest_file = max(approved_files, key=os.path.getctime)
-                    with open(latest_file, 'r', encoding='utf-8') as f:
-                        final_document = f.read()
-                    filename = latest_file
-            else:  # REJECTED
-                # Look for rejection notification files
-                rejection_files = glob.glob("zava_concept_rejection_*.md")
-                if rejection_files:
-                    latest_file = max(rejection_files, key=os.path.getctime)
-                    with open(latest_file, 'r', encoding='utf-8') as f:
-                        final_document = f.read()
-                    filename = latest_file
+            # Read the report the workflow just produced (approval report or rejection email)
+            report_path = workflow_manager.last_report_path
+            if report_path and os.path.isfile(report_path):
+                # Read off the event loop so broadcasts aren't stalled by large reports
+                final_document = await asyncio.to_thread(Path(report_path).read_text, encoding='utf-8')
+                filename = report_path
 
         except Exception as e:
-            print(f"Could not read generated report file: {e}")
+            logger.warning("Could not read generated report file: %s", e)
 
         # Broadcast completion with results
-        await websocket_manager.broadcast_message({
+        await websocket_manager.broadcast_json(build_status_message({
             "type": "workflow_completed",
             "result": result,
             "finalDocument": final_document,
-            "filename": filename,
-            "status": current_analysis_status.model_dump()
-        })
+            "filename": filename
+        }))
 
     except Exception as e:
         error_msg = f"Concept analysis failed: {str(e)}"
-        print(f"Workflow execution error: {error_msg}")
-        print(traceback.format_exc())
+        # The traceback is only formatted if a handler actually emits the record
+        logger.exception("Workflow execution error: %s", error_msg)
 
-        current_analysis_status.status = "error"
-        current_analysis_status.error = error_msg
+        analysis.status = "error"
+        analysis.error = error_msg
+        analysis.dirty()
 
-        await websocket_manager.broadcast_message({
+        await websocket_manager.broadcast_json(build_status_message({
             "type": "error",
-            "error": error_msg,
-            "status": current_analysis_status.model_dump()
-        })
+            "error": error_msg
+        }))
+
+    finally:
+        # Release the upload so the maps and temp directory don't grow on a long-running server
+        app.state.uploads.pop(upload_id, None)
+        app.state.original_filenames.pop(concept_file_path, None)
+        try:
+            await asyncio.to_thread(Path(concept_file_path).unlink, missing_ok=True)
+        except OSError as e:
+            logger.warning("Could not delete uploaded concept file %s: %s", concept_file_path, e)
 
 
 # Application startup and configuration
+def configure_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Route root logging through a queue so log output never blocks the event loop.
+
+    Log records are only enqueued on the event loop; a listener thread does the
+    formatting and console writes. Debug-level workflow diagnostics are skipped
+    unless level is lowered to logging.DEBUG.
+
+    Args:
+        level: Root logger level
+
+    Returns:
+        The started listener; stop it on shutdown to flush queued records
+    """
+    log_queue = queue.SimpleQueue()
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    log_listener = logging.handlers.QueueListener(log_queue, console_handler)
+    # QueueHandler merges args (and any traceback) into the message; the console handler adds the rest
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    # agent_framework calls basicConfig on import, so replace its stderr handler
+    logging.basicConfig(level=level, handlers=[queue_handler], force=True)
+    log_listener.start()
+    return log_listener
+
+
 if __name__ == "__main__":
     import uvicorn
 
+    log_listener = configure_logging()
+
     print("Starting Zava Clothing Concept Analysis Server...")
     print("Navigate to http://localhost:8000 to access the Zava concept analyzer")
     print("WebSocket endpoint available at ws://localhost:8000/ws")
 
-    uvicorn.run(
-        app,
-        host="0.0.0.0",
-        port=8000,
-        log_level="info",
-        reload=False  # Set to True for development
-    )
\ No newline at end of file
+    try:
+        uvicorn.run(
+            app,
+            host="0.0.0.0",
+            port=8000,
+            log_level="info",
+            reload=False  # Set to True for development
+        )
+    finally:
+        # Flush any queued records before exiting
+        log_listener.stop()
\ No newline at end of file
@@ -5,21 +5,152 @@ This module contains agent creation functions for various fashion analysis
 tasks including market research, design evaluation, and production assessment.
 """
 
-from typing import List, Any
-import asyncio
+from typing import Any, Callable, Final, List, Optional
+import os
+import re
 from agent_framework import (
     ChatMessage,
     Role,
-    WorkflowExecutor,
     ConcurrentBuilder,
     AgentExecutor,
     AgentExecutorResponse,
+    WorkflowBuilder,
     WorkflowContext,
     executor
 )
+from core.response_cache import CachedAgent, agent_response_cache
+
+# Specialist agent names; the framework stamps each response message's author_name
+# with them, which is how the analysis executors tell the three analyses apart
+MARKET_RESEARCH_AGENT_NAME: Final[str] = "Fashion Market Research Agent"
+DESIGN_EVALUATION_AGENT_NAME: Final[str] = "Fashion Design Evaluation Agent"
+PRODUCTION_FEASIBILITY_AGENT_NAME: Final[str] = "Production Feasibility Agent"
+
+# System prompts are module-level constants so each agent is created with the
+# same byte-identical instructions, letting the provider reuse its cached prompt
+# prefix across evaluations instead of building the strings per call.
+# Per-role answer formats, shared by the specialist prompts and the unified prompt.
+# Each ends with a Verdict bullet so the executive report can be templated without the report writer
+# (see core.executors._try_templated_synthesis).
+# Verdict bullet each answer format ends with; an echoed "APPROVE or REJECT"
+# placeholder is not a decision
+VERDICT_RE: Final[re.Pattern] = re.compile(
+    r"\*\*Verdict\*\*:\s*(APPROVE|REJECT)\b(?!\s*(?:or|/)\s*(?:APPROVE|REJECT))", re.IGNORECASE
+)
+
+_MARKET_RESEARCH_FORMAT: Final[str] = (
+    "• **Trend Fit**: 1-2 sentences\n"
+    "• **Target Market**: 1 sentence\n"
+    "• **Competition**: 1 sentence\n"
+    "• **Demand**: 1 sentence\n"
+    "• **Price**: 1 sentence\n"
+    "• **Verdict**: APPROVE or REJECT"
+)
+_DESIGN_EVALUATION_FORMAT: Final[str] = (
+    "• **Innovation**: 1 sentence\n"
+    "• **Brand Fit**: 1 sentence\n"
+    "• **Technical**: 1 sentence\n"
+    "• **Materials**: 1 sentence\n"
+    "• **Versatility**: 1 sentence\n"
+    "• **Verdict**: APPROVE or REJECT"
+)
+_PRODUCTION_FEASIBILITY_FORMAT: Final[str] = (
+    "• **Manufacturing**: complexity level\n"
+    "• **Cost**: $ range per unit\n"
+    "• **Sourcing**: availability\n"
+    "• **Quality**: main concern\n"
+    "• **Timeline**: months needed\n"
+    "• **Verdict**: APPROVE or REJECT"
+)
+
+_MARKET_RESEARCH_PROMPT: Final[str] = (
+    "Senior Fashion Market Research Analyst at Zava. Max 100 words, bullets only, direct and specific.\n"
+    + _MARKET_RESEARCH_FORMAT
+)
+
+_DESIGN_EVALUATION_PROMPT: Final[str] = (
+    "Senior Fashion Design Director at Zava. Max 80 words, bullets only.\n"
+    + _DESIGN_EVALUATION_FORMAT
+)
+
+_PRODUCTION_FEASIBILITY_PROMPT: Final[str] = (
+    "Production Director at Zava. Max 70 words, bullets only, one sentence each, include numbers.\n"
+    + _PRODUCTION_FEASIBILITY_FORMAT
+)
+
+_UNIFIED_ANALYSIS_PROMPT: Final[str] = (
+    "Zava concept review panel: market analyst, design director, production director. "
+    "Answer all three in one response under exactly these headings, in order, bullets only, "
+    "nothing before the first heading.\n"
+    "## Market Analysis (max 100 words)\n" + _MARKET_RESEARCH_FORMAT + "\n"
+    "## Design Evaluation (max 80 words)\n" + _DESIGN_EVALUATION_FORMAT + "\n"
+    "## Production Feasibility (max 70 words, include numbers)\n" + _PRODUCTION_FEASIBILITY_FORMAT
+)
+
+# Section headings of the unified analysis, mapped to the agent each section stands in for
+_UNIFIED_ANALYSIS_SECTIONS = {
+    "market analysis": MARKET_RESEARCH_AGENT_NAME,
+    "design evaluation": DESIGN_EVALUATION_AGENT_NAME,
+    "production feasibility": PRODUCTION_FEASIBILITY_AGENT_NAME,
+}
+_UNIFIED_SECTION_HEADING_RE = re.compile(
+    r"^\s*#+\s*(market analysis|design evaluation|production feasibility)\b.*$", re.IGNORECASE | re.MULTILINE
+)
+
+# Agent roles whose short, rigidly formatted bullet output can run on a smaller model
+_MINI_MODEL_ROLES = frozenset({"design", "production"})
+
+# Runaway guard only; the word limits in each prompt control answer length. It leaves
+# room for the trailing Verdict bullet and for reasoning tokens on reasoning deployments
+_MAX_TOKENS: Final[int] = 1024
+
+
+def _has_verdicts(count: int) -> Callable[[str], bool]:
+    """
+    Build a response cache check requiring at least count Verdict bullets.
+
+    An error, a refusal or an answer cut off before its last bullet has no
+    Verdict, so it is not replayed from the response cache.
+
+    Args:
+        count: Number of Verdict bullets a complete response contains
+
+    Returns:
+        Predicate over response text for CachedAgent
+    """
+    return lambda text: len(VERDICT_RE.findall(text)) >= count
+
+_REPORT_WRITER_PROMPT: Final[str] = (
+    "Senior Business Analyst at Zava. Max 150 words, bullets only. Start with APPROVE or REJECT.\n"
+    "• **DECISION**: APPROVE/REJECT + why\n"
+    "• **Market**: key trend\n"
+    "• **Design**: innovation level\n"
+    "• **Production**: cost estimate\n"
+    "• **Risks**: top 2\n"
+    "• **Next Steps**: if approved, top 2 actions"
+)
 
 
-def create_fashion_research_agent(chat_clients_list: List[Any]) -> AgentExecutor:
+def _default_model(role: str) -> Optional[str]:
+    """
+    Resolve the default model deployment for an agent role.
+
+    Design and production agents use AZURE_AI_MINI_MODEL_DEPLOYMENT_NAME when it
+    is set. Every other role, and those two when it is unset, gets None, which
+    runs the agent on its client's AZURE_AI_MODEL_DEPLOYMENT_NAME deployment.
+
+    Args:
+        role: Agent role ("research", "design", "production", "unified" or "report")
+
+    Returns:
+        Model deployment name, or None to use the client's deployment
+    """
+    if role in _MINI_MODEL_ROLES:
+        return os.getenv("AZURE_AI_MINI_MODEL_DEPLOYMENT_NAME") or None
+    return None
+
+
+def create_fashion_research_agent(chat_clients_list: List[Any], model_name: Optional[str] = None) -> AgentExecutor:
     """
     Create an agent specialized in fashion market research and trend analysis.
 
@@ -29,43 +160,27 @@ def create_fashion_research_agent(chat_clients_list: List[Any]) -> AgentExecutor
 
     Args:
         chat_clients_list: List of chat clients for agent communication
+        model_name: Model deployment override; defaults to the role's deployment (see _default_model)
 
     Returns:
         AgentExecutor configured for fashion market research
     """
-    # Define the fashion research agent's expertise and role
-    system_prompt = """You are a Senior Fashion Market Research Analyst at Zava.
-
-    STRICT REQUIREMENTS:
-    - Maximum 100 words total
-    - Use bullet points
-    - Be direct and specific
-    - No fluff or filler text
-
-    Provide:
-    • **Trend Fit**: 1-2 sentences max
-    • **Target Market**: 1 sentence
-    • **Competition**: 1 sentence
-    • **Demand**: 1 sentence
-    • **Price**: 1 sentence
-
-    STOP writing after 100 words."""
-
     # Create the market research agent using chat client
     if not chat_clients_list or len(chat_clients_list) == 0:
         raise ValueError("No chat clients available for agent creation. Please configure Foundry endpoint.")
 
     chat_client = chat_clients_list[0]
     research_agent = chat_client.create_agent(
-        instructions=system_prompt,
-        name="Fashion Market Research Agent",
-        model_name="gpt-4o"  # or use a default model
+        instructions=_MARKET_RESEARCH_PROMPT,
+        name=MARKET_RESEARCH_AGENT_NAME,
+        model=model_name or _default_model("research"),
+        max_tokens=_MAX_TOKENS
     )
-    # Wrap in AgentExecutor for workflow compatibility
-    return AgentExecutor(research_agent, id="fashion_market_research_agent")
+    # Wrap in AgentExecutor for workflow compatibility; repeat concepts are served from the response cache
+    return AgentExecutor(CachedAgent(research_agent, agent_response_cache, _has_verdicts(1)), id="fashion_market_research_agent")
 
 
-def create_design_evaluation_agent(chat_clients_list: List[Any]) -> AgentExecutor:
+def create_design_evaluation_agent(chat_clients_list: List[Any], model_name: Optional[str] = None) -> AgentExecutor:
     """
     Create an agent specialized in fashion design and aesthetic evaluation.
 
@@ -75,40 +190,29 @@ def create_design_evaluation_agent(chat_clients_list: List[Any]) -> AgentExecuto
 
     Args:
         chat_clients_list: List of chat clients for agent communication
+        model_name: Model deployment override; defaults to the role's deployment (see _default_model)
 
     Returns:
         AgentExecutor configured for design evaluation
     """
-    system_prompt = """You are a Senior Fashion Design Director at Zava.
-
-    STRICT REQUIREMENTS:
-    - Maximum 80 words total
-    - Use bullet points only
-    - No lengthy explanations
-
-    Provide:
-    • **Innovation**: 1 sentence max
-    • **Brand Fit**: 1 sentence max
-    • **Technical**: 1 sentence max
-    • **Materials**: 1 sentence max
-    • **Versatility**: 1 sentence max
-
-    STOP writing after 80 words."""
-
     # Create the design evaluation agent using chat client
     if not chat_clients_list or len(chat_clients_list) == 0:
         raise ValueError("No chat clients available for agent creation. Please configure Foundry endpoint.")
 
     chat_client = chat_clients_list[1] if len(chat_clients_list) > 1 else chat_clients_list[0]
     design_agent = chat_client.create_agent(
-        instructions=system_prompt,
-        name="Fashion Design Evaluation Agent",
-        model_name="gpt-4o"
+        instructions=_DESIGN_EVALUATION_PROMPT,
+        name=DESIGN_EVALUATION_AGENT_NAME,
+        model=model_name or _default_model("design"),
+        max_tokens=_MAX_TOKENS
     )
-    return AgentExecutor(design_agent, id="fashion_design_evaluation_agent")
+    return AgentExecutor(CachedAgent(design_agent, agent_response_cache, _has_verdicts(1)), id="fashion_design_evaluation_agent")
 
 
-def create_production_feasibility_agent(chat_clients_list: List[Any]) -> AgentExecutor:
+def create_production_feasibility_agent(
+    chat_clients_list: List[Any],
+    model_name: Optional[str] = None
+) -> AgentExecutor:
     """
     Create an agent specialized in production and manufacturing assessment.
 
@@ -118,119 +222,157 @@ def create_production_feasibility_agent(chat_clients_list: List[Any]) -> AgentEx
 
     Args:
         chat_clients_list: List of chat clients for agent communication
+        model_name: Model deployment override; defaults to the role's deployment (see _default_model)
 
     Returns:
         AgentExecutor configured for production assessment
     """
-    system_prompt = """You are a Production Director at Zava.
-
-    STRICT REQUIREMENTS:
-    - Maximum 70 words total
-    - Use bullet points only
-    - Numbers and costs required
-
-    Provide:
-    • **Manufacturing**: Complexity level (1 sentence)
-    • **Cost**: Specific $ range per unit (1 sentence)
-    • **Sourcing**: Availability (1 sentence)
-    • **Quality**: Main concern (1 sentence)
-    • **Timeline**: Months needed (1 sentence)
-
-    STOP writing after 70 words."""
-
     # Create the production feasibility agent using chat client
     if not chat_clients_list or len(chat_clients_list) == 0:
         raise ValueError("No chat clients available for agent creation. Please configure Foundry endpoint.")
 
     chat_client = chat_clients_list[2] if len(chat_clients_list) > 2 else chat_clients_list[0]
     production_agent = chat_client.create_agent(
-        instructions=system_prompt,
-        name="Production Feasibility Agent",
-        model_name="gpt-4o"
+        instructions=_PRODUCTION_FEASIBILITY_PROMPT,
+        name=PRODUCTION_FEASIBILITY_AGENT_NAME,
+        model=model_name or _default_model("production"),
+        max_tokens=_MAX_TOKENS
     )
-    return AgentExecutor(production_agent, id="production_feasibility_agent")
+    return AgentExecutor(CachedAgent(production_agent, agent_response_cache, _has_verdicts(1)), id="production_feasibility_agent")
 
 
-def create_comprehensive_analysis_agent(chat_clients_list: List[Any]) -> AgentExecutor:
+async def create_concurrent_fashion_analysis_workflow(chat_clients_list: List[Any]):
     """
-    Create an agent that provides comprehensive clothing concept analysis.
+    Create a concurrent workflow that runs multiple fashion analysis agents in parallel.
+
+    Uses ConcurrentBuilder to create a proper concurrent subworkflow that aggregates
+    results from market research, design evaluation, and production assessment agents.
 
-    This agent synthesizes insights from multiple perspectives to provide
-    an overall evaluation and recommendation for Zava's decision-making.
+    The workflow is deliberately built fresh for every analysis rather than cached:
+    each AgentExecutor keeps its agent thread between runs, so a reused workflow
+    would feed one concept's conversation into the next, and a Workflow cannot
+    run concurrently anyway. Building it makes no service calls.
 
     Args:
         chat_clients_list: List of chat clients for agent communication
 
     Returns:
-        AgentExecutor configured for comprehensive analysis
+        Concurrent workflow built with ConcurrentBuilder
     """
-    system_prompt = """You are the Head of Product Development at Zava.
+    print("Creating concurrent fashion analysis workflow...")
+
+    # Create individual analysis agents. create_agent only builds local ChatAgent
+    # objects (no service call happens until the agent runs), so there is nothing
+    # to stagger or overlap here.
+    market_agent = create_fashion_research_agent(chat_clients_list)
+    design_agent = create_design_evaluation_agent(chat_clients_list)
+    production_agent = create_production_feasibility_agent(chat_clients_list)
+
+    # Build concurrent workflow that returns aggregated analysis
+    workflow = ConcurrentBuilder().participants([market_agent, design_agent, production_agent]).build()
+
+    print("Created concurrent fashion analysis workflow with participants:")
+    print("   • Fashion Market Research Agent")
+    print("   • Fashion Design Evaluation Agent")
+    print("   • Production Feasibility Agent")
+
+    return workflow
 
-    STRICT REQUIREMENTS:
-    - Maximum 100 words total
-    - Start with decision word
-    - Use bullet format only
 
-    Provide:
-    • **DECISION**: APPROVE/REJECT/MODIFY (1 word + reason)
-    • **Strategy**: Brand fit (1 sentence)
-    • **Opportunity**: Revenue potential (1 sentence)
-    • **Risks**: Top 2 concerns (bullets)
-    • **Actions**: Top 2 next steps (bullets)
+def create_unified_fashion_analysis_agent(
+    chat_clients_list: List[Any],
+    model_name: Optional[str] = None
+) -> AgentExecutor:
+    """
+    Create a single agent that covers market, design and production analysis in one response.
 
-    STOP writing after 100 words."""
+    The concept text is sent (and prefilled) once instead of once per
+    specialist agent, at the cost of a single combined model turn.
+
+    Args:
+        chat_clients_list: List of chat clients for agent communication
+        model_name: Model deployment override; defaults to the role's deployment (see _default_model)
 
-    # Create the comprehensive analysis agent using chat client
+    Returns:
+        AgentExecutor configured for unified fashion analysis
+    """
     if not chat_clients_list or len(chat_clients_list) == 0:
         raise ValueError("No chat clients available for agent creation. Please configure Foundry endpoint.")
 
-    chat_client = chat_clients_list[-1]  # Use the last client in the list
-    comprehensive_agent = chat_client.create_agent(
-        instructions=system_prompt,
-        name="Comprehensive Fashion Analysis Agent",
-        model_name="gpt-4o"
+    chat_client = chat_clients_list[0]
+    unified_agent = chat_client.create_agent(
+        instructions=_UNIFIED_ANALYSIS_PROMPT,
+        name="Unified Fashion Analysis Agent",
+        model=model_name or _default_model("unified"),
+        max_tokens=_MAX_TOKENS
     )
-    return AgentExecutor(comprehensive_agent, id="comprehensive_fashion_analysis_agent")
+    return AgentExecutor(CachedAgent(unified_agent, agent_response_cache, _has_verdicts(3)), id="unified_fashion_analysis_agent")
 
 
-async def create_concurrent_fashion_analysis_workflow(chat_clients_list: List[Any]):
+@executor(id="unified_fashion_analysis_splitter")
+async def split_unified_fashion_analysis(
+    response: AgentExecutorResponse,
+    ctx: WorkflowContext[None, List[ChatMessage]]
+) -> None:
     """
-    Create a concurrent workflow that runs multiple fashion analysis agents in parallel.
+    Split the unified analysis into per-specialist messages.
 
-    Uses ConcurrentBuilder to create a proper concurrent subworkflow that aggregates
-    results from market research, design evaluation, and production assessment agents.
+    Yields the same shape as the concurrent workflow's aggregator (the user
+    prompt followed by one assistant message per specialist), so downstream
+    executors handle either workflow unchanged.
 
     Args:
-        chat_clients_list: List of chat clients for agent communication
-
-    Returns:
-        Concurrent workflow built with ConcurrentBuilder
+        response: Response from the unified fashion analysis agent
+        ctx: Workflow context for yielding the split analysis
     """
-    print("Creating concurrent fashion analysis workflow...")
+    conversation = response.full_conversation or response.agent_run_response.messages
+    prompt_message = next((message for message in conversation if message.role == Role.USER), None)
+    text = response.agent_run_response.text
 
-    # Create individual analysis agents with staggered initialization to avoid rate limits
-    market_agent = create_fashion_research_agent(chat_clients_list)
-    await asyncio.sleep(0.5)
+    headings = list(_UNIFIED_SECTION_HEADING_RE.finditer(text))
+    sections = []
+    for i, heading in enumerate(headings):
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(text)
+        sections.append(ChatMessage(
+            role=Role.ASSISTANT,
+            text=text[heading.start():end].strip(),
+            author_name=_UNIFIED_ANALYSIS_SECTIONS[heading.group(1).lower()]
+        ))
 
-    design_agent = create_design_evaluation_agent(chat_clients_list)
-    await asyncio.sleep(0.5)
+    if not sections:
+        # Model ignored the headings; pass the whole analysis through as one component
+        sections = [ChatMessage(role=Role.ASSISTANT, text=text, author_name="Unified Fashion Analysis Agent")]
 
-    production_agent = create_production_feasibility_agent(chat_clients_list)
+    await ctx.yield_output(([prompt_message] if prompt_message else []) + sections)
 
-    # Build concurrent workflow that returns aggregated analysis
-    workflow = ConcurrentBuilder().participants([market_agent, design_agent, production_agent]).build()
 
-    print("Created concurrent fashion analysis workflow with participants:")
-    print("   • Fashion Market Research Agent")
-    print("   • Fashion Design Evaluation Agent")
-    print("   • Production Feasibility Agent")
+async def create_unified_fashion_analysis_workflow(chat_clients_list: List[Any]):
+    """
+    Create a workflow that runs market, design and production analysis as one agent call.
 
-    return workflow
+    Drop-in alternative to create_concurrent_fashion_analysis_workflow: its output
+    has the same shape, but the concept is analyzed in one model turn instead of three.
 
+    Args:
+        chat_clients_list: List of chat clients for agent communication
 
+    Returns:
+        Workflow that yields the analysis split into per-specialist messages
+    """
+    print("Creating unified fashion analysis workflow...")
+
+    unified_agent = create_unified_fashion_analysis_agent(chat_clients_list)
+    return WorkflowBuilder()\
+        .set_start_executor(unified_agent)\
+        .add_edge(unified_agent, split_unified_fashion_analysis)\
+        .build()
 
 
-def create_concept_report_writer_agent(chat_clients_list: List[Any]) -> AgentExecutor:
+def create_concept_report_writer_agent(
+    chat_clients_list: List[Any],
+    stream: bool = False,
+    model_name: Optional[str] = None
+) -> AgentExecutor:
     """
     Create an agent specialized in writing comprehensive clothing concept reports.
 
@@ -239,35 +381,21 @@ def create_concept_report_writer_agent(chat_clients_list: List[Any]) -> AgentExe
 
     Args:
         chat_clients_list: List of chat clients for agent communication
+        model_name: Model deployment override; defaults to the role's deployment (see _default_model)
+        stream: Emit the report incrementally as AgentRunUpdateEvents while it is generated
 
     Returns:
         AgentExecutor configured for report writing
     """
-    system_prompt = """You are a Senior Business Analyst at Zava.
-
-    STRICT REQUIREMENTS:
-    - Maximum 150 words total
-    - Start with APPROVE or REJECT
-    - Use bullet format
-
-    Provide:
-    • **DECISION**: APPROVE/REJECT + why (1 sentence)
-    • **Market**: Key trend (1 sentence)
-    • **Design**: Innovation level (1 sentence)
-    • **Production**: Cost estimate (1 sentence)
-    • **Risks**: Top 2 risks (bullet points)
-    • **Next Steps**: If approved, top 2 actions (bullet points)
-
-    STOP writing after 150 words."""
-
     # Create the report writer agent using chat client
     if not chat_clients_list or len(chat_clients_list) == 0:
         raise ValueError("No chat clients available for agent creation. Please configure Foundry endpoint.")
 
     chat_client = chat_clients_list[0]
     report_agent = chat_client.create_agent(
-        instructions=system_prompt,
+        instructions=_REPORT_WRITER_PROMPT,
         name="Concept Report Writer Agent",
-        model_name="gpt-4o"
+        model=model_name or _default_model("report"),
+        max_tokens=_MAX_TOKENS
     )
-    return AgentExecutor(report_agent, id="concept_report_writer_agent")
\ No newline at end of file
+    return AgentExecutor(report_agent, streaming=stream, id="concept_report_writer_agent")
\ No newline at end of file
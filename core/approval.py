@@ -5,8 +5,10 @@ This module handles the human-in-the-loop approval process where Zava team membe
 review and make final decisions on clothing concept submissions.
 """
 
+import logging
 from typing import Any
 from dataclasses import dataclass
+from functools import cached_property
 
 from agent_framework import (
     Executor,
@@ -17,6 +19,32 @@ from agent_framework import (
     handler
 )
 
+logger = logging.getLogger(__name__)
+
+# Context shown to the Zava team with each approval request; only the analysis varies
+_APPROVAL_CONTEXT_TEMPLATE = """
+COMPREHENSIVE CLOTHING CONCEPT ANALYSIS SUMMARY
+
+The fashion analysis agents have completed their evaluation of this clothing concept
+submission. Below is the consolidated analysis covering market potential, design merit,
+and production feasibility:
+
+ {analysis}
+
+KEY DECISION FACTORS:
+• Market alignment with current fashion trends
+• Design innovation and brand fit with Zava
+• Production feasibility and cost considerations
+• Competitive differentiation potential
+• Strategic alignment with company goals
+
+This decision will determine whether Zava proceeds with concept development
+or provides constructive feedback for future submissions.
+""".strip()
+
+# Normalized human responses that approve a concept; any other response rejects it
+_APPROVAL_TOKENS = frozenset(("yes", "y", "approve", "approved"))
+
 
 @dataclass
 class ClothingConceptApprovalRequest(RequestInfoMessage):
@@ -33,6 +61,11 @@ class ClothingConceptApprovalRequest(RequestInfoMessage):
 
     def __str__(self) -> str:
         """Return a formatted string representation of the approval request."""
+        return self.rendered
+
+    @cached_property
+    def rendered(self) -> str:
+        """Approval prompt text, built once since the request isn't modified after it is sent."""
         return f"""
 ZAVA CLOTHING CONCEPT APPROVAL REQUEST
 
@@ -52,13 +85,14 @@ Your decision will determine the next steps in our evaluation process.
         """.strip()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ZavaApprovalDecision:
     """
     Data structure to represent approval decisions for clothing concepts.
 
     This class encapsulates the decision outcome and associated metadata
-    for tracking approval workflow results.
+    for tracking approval workflow results. Decisions are immutable value
+    objects created once per human response.
     """
 
     approved: bool
@@ -85,42 +119,17 @@ class ZavaConceptApprovalManager(Executor):
     @handler
     async def start_approval(self, analysis_results: Any, ctx: WorkflowContext[ClothingConceptApprovalRequest]) -> None:
         """Initiates approval request to human."""
-        print("=" * 80)
-        print("APPROVAL MANAGER: start_approval handler called")
-        print("=" * 80)
-        print(f"APPROVAL MANAGER: Received analysis_results type: {type(analysis_results)}")
-        print(f"APPROVAL MANAGER: Analysis results length: {len(str(analysis_results))} chars")
-        print("Starting Zava concept approval process...")
-
         # Extract key information from analysis results
+        # Stringify once; the text is reused for logging, the context and the request
         analysis_text = str(analysis_results) if analysis_results else "No analysis provided"
-
-        print("=" * 60)
-        print("FASHION ANALYSIS RESULTS:")
-        print("=" * 60)
-        print(analysis_text[:1000] + ('...' if len(analysis_text) > 1000 else ''))
-        print("=" * 60)
+        analysis_len = len(analysis_text)
+        logger.info("Starting Zava concept approval process (%d chars of analysis)", analysis_len)
+        if logger.isEnabledFor(logging.DEBUG):
+            preview = analysis_text if analysis_len <= 1000 else analysis_text[:1000] + '...'
+            logger.debug("Fashion analysis results (%s):\n%s", type(analysis_results).__name__, preview)
 
         # Create comprehensive context for the approval decision
-        approval_context = f"""
-COMPREHENSIVE CLOTHING CONCEPT ANALYSIS SUMMARY
-
-The fashion analysis agents have completed their evaluation of this clothing concept
-submission. Below is the consolidated analysis covering market potential, design merit,
-and production feasibility:
-
- {analysis_text}
-
-KEY DECISION FACTORS:
-• Market alignment with current fashion trends
-• Design innovation and brand fit with Zava
-• Production feasibility and cost considerations
-• Competitive differentiation potential
-• Strategic alignment with company goals
-
-This decision will determine whether Zava proceeds with concept development
-or provides constructive feedback for future submissions.
-        """.strip()
+        approval_context = _APPROVAL_CONTEXT_TEMPLATE.format(analysis=analysis_text)
 
         approval_request = ClothingConceptApprovalRequest(
             question="Based on the comprehensive fashion analysis above, should Zava approve this clothing concept for development?",
@@ -128,12 +137,8 @@ or provides constructive feedback for future submissions.
             analysis_content=analysis_text
         )
 
-        print("APPROVAL MANAGER: Sending approval request to Zava design team...")
-        print(f"APPROVAL MANAGER: Approval request type: {type(approval_request)}")
-        print(f"APPROVAL MANAGER: Request question: {approval_request.question[:50]}...")
         await ctx.send_message(approval_request)
-        print("APPROVAL MANAGER: Approval request sent successfully to human approver")
-        print("=" * 80)
+        logger.info("Approval request sent to the Zava design team")
 
     @handler
     async def route_decision(
@@ -142,178 +147,79 @@ or provides constructive feedback for future submissions.
         ctx: WorkflowContext[ZavaApprovalDecision]
     ) -> None:
         """Processes human response and prepares routing decision."""
-        print("=" * 80)
-        print("APPROVAL MANAGER: route_decision handler called")
-        print("=" * 80)
-        print(f"APPROVAL MANAGER: Received response type: {type(response)}")
-        print(f"APPROVAL MANAGER: Response data: {response.data}")
-
-        if hasattr(response, 'original_request'):
-            print(f"APPROVAL MANAGER: Original request type: {type(response.original_request)}")
-            print(f"APPROVAL MANAGER: Original request question: {response.original_request.question[:50]}..." if hasattr(response.original_request, 'question') else "N/A")
-
-        print("Processing human approval response...")
-        human_input = (response.data or "").strip().lower()
-        print(f"APPROVAL MANAGER: Human input normalized: '{human_input}'")
+        response_data = response.data or ""
+        logger.debug("Human approval response: %r", response_data)
 
-        # Parse human input into routing decision
-        approved = human_input in ["yes", "y", "approve", "approved"]
-        print(f"APPROVAL MANAGER: Approval status: {approved}")
+        # Parse human input into routing decision; single-key answers ("y"/"n") skip normalization
+        if isinstance(response_data, str) and len(response_data) == 1:
+            approved = response_data in "yY"
+        else:
+            approved = _unwrap(response_data) in _APPROVAL_TOKENS
 
         # Get analysis content from the original request
         analysis_content = response.original_request.analysis_content if response.original_request else ""
-        print(f"APPROVAL MANAGER: Analysis content length: {len(analysis_content)} chars")
 
         decision = ZavaApprovalDecision(
             approved=approved,
-            feedback=response.data or "",
+            feedback=response_data,
             analysis_content=analysis_content
         )
-        print(f"APPROVAL MANAGER: Created decision: {decision}")
 
-        print(f"Zava team decision - {'APPROVED' if approved else 'REJECTED'}")
-        print("APPROVAL MANAGER: Sending decision to trigger conditional routing...")
+        logger.info("Zava team decision - %s", "APPROVED" if approved else "REJECTED")
         await ctx.send_message(decision)
-        print("APPROVAL MANAGER: Decision sent successfully")
-        print("=" * 80)
+
+
+def _unwrap(response: Any) -> str:
+    """Return the normalized text of a human response, peeling any nested RequestResponse wrappers."""
+    while hasattr(response, 'data'):
+        response = response.data
+    return str(response or "").lower().strip()
 
 
 def concept_approval_condition(decision: Any) -> bool:
     """
     Condition function to check if a clothing concept was approved.
 
+    route_decision normalizes every human response into a ZavaApprovalDecision,
+    so anything else the approval manager sends (its approval requests) never routes.
+
     Args:
-        decision: Human approval response (RequestResponse or str)
+        decision: Message sent by the approval manager
 
     Returns:
         True if the concept was approved, False otherwise
     """
-    print("=" * 60)
-    print("CONDITION: concept_approval_condition called")
-    print(f"CONDITION: Decision type: {type(decision)}")
-    print(f"CONDITION: Decision value: {decision}")
-
-    # Handle RequestResponse from human approver
-    if hasattr(decision, 'data'):
-        print(f"CONDITION: Has data attribute, data type: {type(decision.data)}")
-        print(f"CONDITION: Data value: {decision.data}")
-
-        # Handle nested RequestResponse
-        if hasattr(decision.data, 'data'):
-            print("CONDITION: Detected nested RequestResponse - extracting inner data")
-            response_text = str(decision.data.data).lower().strip()
-        else:
-            response_text = str(decision.data).lower().strip()
-
-        result = response_text in ['yes', 'y', 'approve', 'approved']
-        print(f"CONDITION: Approval check result: {result} (response_text: '{response_text}')")
-        print("=" * 60)
-        return result
-
-    # Handle string responses directly
-    if isinstance(decision, str):
-        result = decision.lower().strip() in ['yes', 'y', 'approve', 'approved']
-        print(f"CONDITION: String approval check result: {result} (decision: '{decision}')")
-        print("=" * 60)
-        return result
-
-    # Handle ZavaApprovalDecision objects
-    if isinstance(decision, ZavaApprovalDecision):
-        result = decision.approved
-        print(f"CONDITION: ZavaApprovalDecision approval result: {result}")
-        print(f"CONDITION: Decision details - approved: {decision.approved}, feedback: '{decision.feedback}'")
-        print("=" * 60)
-        return result
-
-    # Handle ClothingConceptApprovalRequest (should be ignored in conditions)
-    if isinstance(decision, ClothingConceptApprovalRequest):
-        print("CONDITION: Received ClothingConceptApprovalRequest - ignoring (not a response)")
-        print("=" * 60)
-        return False
-
-    # Handle other types by checking for approval attributes
-    if hasattr(decision, 'approved'):
-        result = decision.approved
-        print(f"CONDITION: Approved attribute result: {result}")
-        print("=" * 60)
-        return result
-
-    # Default to False for unknown types
-    print("CONDITION: Unknown type - defaulting to False")
-    print("=" * 60)
-    return False
+    return isinstance(decision, ZavaApprovalDecision) and decision.approved
 
 
 def concept_rejection_condition(decision: Any) -> bool:
     """
     Condition function to check if a clothing concept was rejected.
 
+    The exact complement of concept_approval_condition for everything except
+    approval requests, so unrecognized messages fall to rejection as a safety measure.
+
     Args:
-        decision: Human approval response (RequestResponse or str)
+        decision: Message sent by the approval manager
 
     Returns:
         True if the concept was rejected, False otherwise
     """
-    print("=" * 60)
-    print("CONDITION: concept_rejection_condition called")
-    print(f"CONDITION: Decision type: {type(decision)}")
-    print(f"CONDITION: Decision value: {decision}")
-
-    # Handle RequestResponse from human approver
-    if hasattr(decision, 'data'):
-        print(f"CONDITION: Has data attribute, data type: {type(decision.data)}")
-        print(f"CONDITION: Data value: {decision.data}")
-
-        # Handle nested RequestResponse
-        if hasattr(decision.data, 'data'):
-            print("CONDITION: Detected nested RequestResponse - extracting inner data")
-            response_text = str(decision.data.data).lower().strip()
-        else:
-            response_text = str(decision.data).lower().strip()
-
-        result = response_text in ['no', 'n', 'reject', 'rejected', 'deny', 'denied']
-        print(f"CONDITION: Rejection check result: {result} (response_text: '{response_text}')")
-        print("=" * 60)
-        return result
-
-    # Handle string responses directly
-    if isinstance(decision, str):
-        result = decision.lower().strip() in ['no', 'n', 'reject', 'rejected', 'deny', 'denied']
-        print(f"CONDITION: String rejection check result: {result} (decision: '{decision}')")
-        print("=" * 60)
-        return result
-
-    # Handle ZavaApprovalDecision objects
-    if isinstance(decision, ZavaApprovalDecision):
-        result = not decision.approved
-        print(f"CONDITION: ZavaApprovalDecision rejection result: {result}")
-        print(f"CONDITION: Decision details - approved: {decision.approved}, feedback: '{decision.feedback}'")
-        print("=" * 60)
-        return result
-
-    # Handle ClothingConceptApprovalRequest (should be ignored in conditions)
+    # Approval requests are not responses and never route
     if isinstance(decision, ClothingConceptApprovalRequest):
-        print("CONDITION: Received ClothingConceptApprovalRequest - ignoring (not a response)")
-        print("=" * 60)
         return False
-
-    # Handle other types by checking for approval attributes
-    if hasattr(decision, 'approved'):
-        result = not decision.approved
-        print(f"CONDITION: Approved attribute rejection result: {result}")
-        print("=" * 60)
-        return result
-
-    # Default to True (reject) for unknown types as a safety measure
-    print("CONDITION: Unknown type - defaulting to True (reject)")
-    print("=" * 60)
-    return True
+    return not concept_approval_condition(decision)
 
 
 def create_zava_human_approver() -> RequestInfoExecutor:
     """
     Create a human approver executor for Zava clothing concept decisions.
 
+    A new executor is returned for every workflow build rather than a shared
+    instance: RequestInfoExecutor tracks its pending requests on the instance,
+    so sharing one would carry an abandoned analysis's approval request into
+    the next workflow.
+
     Returns:
         RequestInfoExecutor configured for human approval workflow
     """
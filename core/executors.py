@@ -5,26 +5,263 @@ This module contains the core workflow executors that process clothing concept
 pitches through various analysis stages.
 """
 
-import json
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional, Union
 import uuid
 
+import orjson
 from agent_framework import (
     WorkflowContext,
     executor,
     AgentExecutorResponse,
-    Message
+    Message,
+    Role
 )
-from core.approval import ClothingConceptApprovalRequest
 
+from core.agents import (
+    DESIGN_EVALUATION_AGENT_NAME,
+    MARKET_RESEARCH_AGENT_NAME,
+    PRODUCTION_FEASIBILITY_AGENT_NAME,
+    VERDICT_RE
+)
 from services.pitch_parser import extract_clothing_concept_data
 from services.report_generator import ZavaFashionReportGenerator
 
+logger = logging.getLogger(__name__)
+
 # Module-level cache for concept metadata (to pass through concurrent workflow)
 _concept_metadata_cache = {}
 
+# Shared by the report executors; the generator holds only constant settings
+_report_generator = ZavaFashionReportGenerator()
+
+# Keywords that categorize an analysis response, in priority order: a response is
+# filed under the first category any of whose keywords starts a word in it, so
+# "trends" and "designer" count but "supermarket" does not
+_COMPONENT_KEYWORDS = (
+    ("market_trend_analysis", ("market", "trend", "consumer", "demand", "demographic")),
+    ("design_evaluation", ("design", "aesthetic", "style", "color", "fabric", "material")),
+    ("production_feasibility", ("production", "manufacturing", "cost", "supply", "logistics")),
+    ("sustainability_assessment", ("sustainability", "ethical", "environmental", "eco")),
+)
+# Component each specialist agent's response is filed under; keyword matching is
+# only the fallback for responses from other authors
+_COMPONENT_BY_AGENT_NAME = {
+    MARKET_RESEARCH_AGENT_NAME: "market_trend_analysis",
+    DESIGN_EVALUATION_AGENT_NAME: "design_evaluation",
+    PRODUCTION_FEASIBILITY_AGENT_NAME: "production_feasibility",
+}
+_COMPONENT_PRIORITY = {name: priority for priority, (name, _) in enumerate(_COMPONENT_KEYWORDS)}
+# One alternation with a named group per category, so a response is scanned once
+_COMPONENT_KEYWORD_RE = re.compile(
+    r"\b(?:" + "|".join(f"(?P<{name}>{'|'.join(keywords)})" for name, keywords in _COMPONENT_KEYWORDS) + ")",
+    re.IGNORECASE
+)
+
+# Slide keywords (matched anywhere in the text, like "trend" in "trending") that tag
+# a slide as a market signal or a production note
+_MARKET_SIGNAL_RE = re.compile(
+    "target|audience|market|customer|demographic|price|competitor|trend|season", re.IGNORECASE
+)
+_PRODUCTION_NOTE_RE = re.compile(
+    "fabric|material|manufacturing|cost|supplier|production|quality|sizes|fit", re.IGNORECASE
+)
+
+# Analysis request sent to the fashion analysis agents; only the concept details vary
+_ANALYSIS_PROMPT_TEMPLATE = """ZAVA CLOTHING CONCEPT ANALYSIS REQUEST
+
+Concept File: {file_name}
+Total Slides: {total_slides}
+Fashion Elements: {concept_elements}
+
+Please analyze this clothing concept submission from the perspective of Zava,
+a fashion-forward clothing company evaluating new design concepts.
+
+CONCEPT CONTENT:
+{concept_content}
+
+Please provide comprehensive analysis covering:
+1. Market potential and fashion trend alignment
+2. Design innovation and aesthetic appeal
+3. Production feasibility and cost considerations
+4. Brand fit with Zava's positioning
+5. Competitive differentiation opportunities
+
+Focus on actionable insights that will help determine whether to approve
+this concept for development."""
+
+
+@dataclass(slots=True)
+class TemplatedConceptReport:
+    """
+    Executive report assembled without the report writer agent.
+
+    Sent straight to the approval manager when all three specialist analyses
+    reach the same verdict, so the synthesis model call is skipped.
+    """
+
+    content: str
+
+    def __str__(self) -> str:
+        return self.content
+
+
+@dataclass(slots=True)
+class _ExtractedAgentResponse:
+    """
+    Stand-in for AgentExecutorResponse built from one agent's message in a concurrent result.
+
+    Exposes the attributes the consolidation loop reads, so extracted messages and
+    real executor responses are handled the same way.
+    """
+
+    output: str
+    agent_run_response: str
+    executor_id: str
+
+
+def _dumps(data: Any, indent: bool = False) -> str:
+    """
+    Serialize data to a JSON string with orjson.
+
+    Args:
+        data: JSON-compatible data
+        indent: Indent with two spaces, for text embedded in prompt prose
+
+    Returns:
+        JSON text
+    """
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None).decode()
+
+
+def _error_payload(error_msg: str, error_type: str) -> str:
+    """
+    Build the structured error message executors send downstream when a step fails.
+
+    Args:
+        error_msg: Human-readable description of the failure
+        error_type: Machine-readable failure category
+
+    Returns:
+        JSON text with error, error_type and timestamp fields
+    """
+    # orjson writes the datetime in the same format as isoformat()
+    return _dumps({"error": error_msg, "error_type": error_type, "timestamp": datetime.now()})
+
+
+def _bullet_value(analysis: str, label: str) -> str:
+    """Return the text of a '**label**: value' bullet in an analysis, or an empty string."""
+    match = re.search(rf"\*\*{re.escape(label)}\*\*:\s*(.+)", analysis)
+    return match.group(1).strip() if match else ""
+
+
+def _try_templated_synthesis(market: str, design: str, production: str) -> Optional[str]:
+    """
+    Build the executive report from the specialist analyses without a model call.
+
+    Only unanimous verdicts are templated: a split between the specialists is
+    exactly the case that needs the report writer's synthesis.
+
+    Args:
+        market: Market research analysis text
+        design: Design evaluation analysis text
+        production: Production feasibility analysis text
+
+    Returns:
+        Report in the report writer's bullet format, or None if the verdicts
+        are split or any analysis has no verdict, e.g. because it was cut off
+        before its last bullet (the report writer agent is used instead)
+    """
+    verdicts = set()
+    for analysis in (market, design, production):
+        # The Verdict bullet comes last, so take the last one the analysis contains
+        found = VERDICT_RE.findall(analysis or "")
+        if not found:
+            return None
+        verdicts.add(found[-1].upper())
+
+    if len(verdicts) != 1:
+        return None
+    decision = verdicts.pop()
+    outcome = "approval" if decision == "APPROVE" else "rejection"
+
+    if decision == "APPROVE":
+        next_steps = (
+            f"1) Confirm sourcing: {_bullet_value(production, 'Sourcing') or 'see production analysis'}; "
+            f"2) Plan the production timeline: {_bullet_value(production, 'Timeline') or 'see production analysis'}"
+        )
+    else:
+        next_steps = "None - concept not approved for development"
+
+    return "\n".join([
+        f"• **DECISION**: {decision} - market, design and production analyses all recommend {outcome}",
+        f"• **Market**: {_bullet_value(market, 'Trend Fit') or 'See market analysis'}",
+        f"• **Design**: {_bullet_value(design, 'Innovation') or 'See design evaluation'}",
+        f"• **Production**: {_bullet_value(production, 'Cost') or 'See production analysis'}",
+        f"• **Risks**: {_bullet_value(production, 'Quality') or 'See production analysis'}",
+        f"• **Next Steps**: {next_steps}",
+    ])
+
+
+def _render_and_save_report(
+    render: Callable[..., str],
+    filename_prefix: str,
+    report_type: str,
+    **render_kwargs: Any
+) -> str:
+    """
+    Render a report and write it to disk in one call, so both run in the same worker thread.
+
+    Args:
+        render: Report generator method that returns the report content
+        filename_prefix: Prefix for the saved report file
+        report_type: Report type recorded in the saved file
+        **render_kwargs: Arguments passed through to render
+
+    Returns:
+        Path of the saved report
+    """
+    report_content = render(**render_kwargs)
+    return _report_generator.save_report_to_file(
+        report_content=report_content,
+        filename_prefix=filename_prefix,
+        report_type=report_type
+    )
+
+
+def _classify_component(analysis: str) -> Optional[str]:
+    """
+    Categorize an analysis response by its keywords in a single scan.
+
+    Args:
+        analysis: Analysis text from one agent
+
+    Returns:
+        Component name of the highest-priority category found, or None if no keyword matches
+    """
+    best = None
+    for match in _COMPONENT_KEYWORD_RE.finditer(analysis):
+        if best is None or _COMPONENT_PRIORITY[match.lastgroup] < _COMPONENT_PRIORITY[best]:
+            best = match.lastgroup
+            if _COMPONENT_PRIORITY[best] == 0:
+                break
+    return best
+
+
+def needs_report_writer(message: Any) -> bool:
+    """Edge condition: consolidated analyses that still need the report writer agent."""
+    return not isinstance(message, TemplatedConceptReport)
+
+
+def is_templated_report(message: Any) -> bool:
+    """Edge condition: reports synthesized without the report writer agent."""
+    return isinstance(message, TemplatedConceptReport)
+
 
 @executor(id="clothing_concept_parser")
 async def process_clothing_concept_pitch(file_path: str, ctx: WorkflowContext[str]) -> None:
@@ -38,46 +275,42 @@ async def process_clothing_concept_pitch(file_path: str, ctx: WorkflowContext[st
         file_path: Path to the .pptx file containing the clothing concept pitch
         ctx: Workflow context for sending results to the next stage
     """
-    print("STEP 1: Starting clothing concept pitch analysis...")
+    logger.info("STEP 1: Starting clothing concept pitch analysis")
 
     try:
         # Extract all data from the clothing concept presentation
         concept_data_json = extract_clothing_concept_data(file_path)
 
+        concept_data = orjson.loads(concept_data_json)
+
         # Override filename with original if available in cache
         original_filename = _concept_metadata_cache.get("original_filename")
-        if original_filename:
-            concept_data = json.loads(concept_data_json)
-            if "error" not in concept_data:
-                concept_data["concept_file_name"] = original_filename
-                concept_data_json = json.dumps(concept_data)
-                print(f"STEP 1: Using original filename: {original_filename}")
+        if original_filename and "error" not in concept_data:
+            concept_data["concept_file_name"] = original_filename
+            concept_data_json = _dumps(concept_data)
+            logger.debug("STEP 1: Using original filename: %s", original_filename)
 
         # Log successful parsing
-        concept_data = json.loads(concept_data_json)
         if "error" not in concept_data:
             slides_count = concept_data.get('total_slides', 0)
             elements_count = concept_data.get('concept_summary', {}).get('total_concept_elements', 0)
 
-            print(f"SUCCESS: Successfully parsed clothing concept with {slides_count} slides")
-            print(f"INFO: Identified {elements_count} fashion-related elements")
+            logger.info(
+                "STEP 1: Parsed clothing concept with %d slides and %d fashion-related elements",
+                slides_count, elements_count
+            )
         else:
-            print(f"ERROR: Error parsing concept: {concept_data['error']}")
+            logger.error("STEP 1: Error parsing concept: %s", concept_data['error'])
 
         # Send the extracted data to the next workflow step
         await ctx.send_message(concept_data_json)
 
     except Exception as e:
-        error_msg = f"Failed to process clothing concept pitch: {str(e)}"
-        print(f"STEP 1 ERROR: {error_msg}")
+        error_msg = f"Failed to process clothing concept pitch: {e}"
+        logger.exception("STEP 1: %s", error_msg)
 
         # Send error information in a structured format
-        error_data = {
-            "error": error_msg,
-            "error_type": "concept_parsing_error",
-            "timestamp": datetime.now().isoformat()
-        }
-        await ctx.send_message(json.dumps(error_data))
+        await ctx.send_message(_error_payload(error_msg, "concept_parsing_error"))
 
 
 @executor(id="extract_analysis_prompt_for_concurrent")
@@ -92,70 +325,55 @@ async def extract_analysis_prompt(data_package_json: str, ctx: WorkflowContext[s
         data_package_json: JSON containing workflow_id and analysis_prompt
         ctx: Workflow context for sending the prompt
     """
-    print("=" * 80)
-    print("INTERMEDIATE: EXTRACT_ANALYSIS_PROMPT - STARTING")
-    print("=" * 80)
-
     try:
-        data_package = json.loads(data_package_json)
+        data_package = orjson.loads(data_package_json)
         workflow_id = data_package.get("workflow_id")
         analysis_prompt = data_package.get("analysis_prompt")
 
-        print(f"INTERMEDIATE: Extracted workflow_id: {workflow_id}")
-        print(f"INTERMEDIATE: Analysis prompt length: {len(analysis_prompt)} characters")
-        print(f"INTERMEDIATE: Sending analysis prompt to concurrent workflow")
+        logger.debug(
+            "INTERMEDIATE: workflow_id %s, analysis prompt of %d characters", workflow_id, len(analysis_prompt)
+        )
 
         # Also store the workflow_id in cache so step 4 can retrieve it
         _concept_metadata_cache["current_workflow_id"] = workflow_id
 
         # Send just the analysis prompt to the concurrent workflow
         await ctx.send_message(analysis_prompt)
-        print("INTERMEDIATE: Analysis prompt sent successfully")
-        print("=" * 80)
 
     except Exception as e:
-        error_msg = f"Failed to extract analysis prompt: {str(e)}"
-        print(f"INTERMEDIATE ERROR: {error_msg}")
+        error_msg = f"Failed to extract analysis prompt: {e}"
+        logger.exception("INTERMEDIATE: %s", error_msg)
         await ctx.send_message(f"ERROR: {error_msg}")
 
 
 @executor(id="concurrent_fashion_analysis_logger")
-async def log_fashion_analysis_outputs(concurrent_message: Any, ctx: WorkflowContext[str]) -> None:
+async def log_fashion_analysis_outputs(
+    concurrent_message: Any, ctx: WorkflowContext[Union[str, TemplatedConceptReport]]
+) -> None:
     """
     Process and log outputs from concurrent fashion analysis agents.
 
     This executor receives results from the concurrent fashion analysis workflow
-    and consolidates them for report generation.
+    and consolidates them for report generation. When all three specialist
+    verdicts can be parsed, a templated report is sent straight to approval
+    instead of running the report writer agent.
 
     Args:
         concurrent_message: Message from concurrent fashion analysis workflow
         ctx: Workflow context for sending consolidated results
     """
-    print("=" * 80)
-    print("STEP 4: LOG_FASHION_ANALYSIS_OUTPUTS - STARTING")
-    print("=" * 80)
-    print(f"ROUTING: Received message type: {type(concurrent_message)}")
-    print(f"ROUTING: Message attributes: {dir(concurrent_message)}")
-
-    if hasattr(concurrent_message, 'data'):
-        print(f"ROUTING: Message.data type: {type(concurrent_message.data)}")
-        print(f"ROUTING: Message.data length: {len(concurrent_message.data) if concurrent_message.data else 0}")
-
-    if hasattr(concurrent_message, 'source_id'):
-        print(f"ROUTING: Message.source_id: {concurrent_message.source_id}")
-
-    if hasattr(concurrent_message, 'target_id'):
-        print(f"ROUTING: Message.target_id: {concurrent_message.target_id}")
-
-    print("=" * 80)
+    logger.info("STEP 4: Consolidating fashion analysis outputs")
+    logger.debug("STEP 4: Received message type: %s", type(concurrent_message).__name__)
 
     try:
         # Retrieve concept metadata from cache
         workflow_id = _concept_metadata_cache.get("current_workflow_id")
         concept_metadata = _concept_metadata_cache.get(workflow_id, {})
 
-        print(f"STEP 4: Retrieved workflow_id: {workflow_id}")
-        print(f"STEP 4: Retrieved concept metadata: {concept_metadata.get('concept_file_name', 'Unknown')}")
+        logger.debug(
+            "STEP 4: Retrieved workflow_id %s for concept %s",
+            workflow_id, concept_metadata.get('concept_file_name', 'Unknown')
+        )
 
         consolidated_analysis = {
             "analysis_timestamp": datetime.now().isoformat(),
@@ -169,55 +387,44 @@ async def log_fashion_analysis_outputs(concurrent_message: Any, ctx: WorkflowCon
 
         # Handle different input types from the concurrent workflow
         if isinstance(concurrent_message, list):
-            print("ROUTING: Received raw list from concurrent workflow - processing directly")
             # Direct list of responses from ConcurrentBuilder
             for i, item in enumerate(concurrent_message):
+                if getattr(item, 'role', None) == Role.USER:
+                    # The aggregated conversation starts with the analysis prompt itself
+                    continue
                 if hasattr(item, 'contents') and item.contents:
-                    # ChatMessage format
-                    text_content = ""
-                    for content in item.contents:
-                        if hasattr(content, 'text'):
-                            text_content += content.text + " "
+                    # ChatMessage format; join once rather than growing a string per content part
+                    text_content = " ".join(
+                        content.text for content in item.contents if hasattr(content, 'text')
+                    ).strip()
 
                     agent_name = getattr(item, 'author_name', f"agent_{i + 1}")
-                    mock_response = type('AgentExecutorResponse', (), {
-                        'output': text_content.strip(),
-                        'agent_run_response': text_content.strip(),
-                        'executor_id': agent_name
-                    })()
-                    responses.append(mock_response)
-                    print(f"EXTRACTED: {agent_name}: {len(text_content.strip())} characters")
+                    responses.append(_ExtractedAgentResponse(text_content, text_content, agent_name))
+                    logger.debug("EXTRACTED: %s: %d characters", agent_name, len(text_content))
                 else:
                     # Handle other response formats
                     responses.append(item)
-                    print(f"EXTRACTED: Response {i+1}: {len(str(item))} characters")
 
         elif hasattr(concurrent_message, 'data') and concurrent_message.data:
-            print("ROUTING: Received Message object - extracting data")
             # Message wrapper around the responses
             chat_messages = concurrent_message.data
             for i, chat_msg in enumerate(chat_messages):
+                if getattr(chat_msg, 'role', None) == Role.USER:
+                    continue
                 if hasattr(chat_msg, 'contents') and chat_msg.contents:
                     # Extract text content from ChatMessage
-                    text_content = ""
-                    for content in chat_msg.contents:
-                        if hasattr(content, 'text'):
-                            text_content += content.text + " "
+                    text_content = " ".join(
+                        content.text for content in chat_msg.contents if hasattr(content, 'text')
+                    ).strip()
 
                     # Get the agent name
                     agent_name = getattr(chat_msg, 'author_name', f"agent_{i + 1}")
 
-                    # Create a mock AgentExecutorResponse for compatibility
-                    mock_response = type('AgentExecutorResponse', (), {
-                        'output': text_content.strip(),
-                        'agent_run_response': text_content.strip(),
-                        'executor_id': agent_name
-                    })()
-                    responses.append(mock_response)
-
-                    print(f"EXTRACTED: {agent_name}: {len(text_content.strip())} characters")
+                    # Wrap as an AgentExecutorResponse stand-in for compatibility
+                    responses.append(_ExtractedAgentResponse(text_content, text_content, agent_name))
+                    logger.debug("EXTRACTED: %s: %d characters", agent_name, len(text_content))
         else:
-            print("WARNING: Unknown concurrent message format")
+            logger.warning("STEP 4: Unknown concurrent message format %s", type(concurrent_message).__name__)
             # Fallback to treating the message as a single response
             responses = [concurrent_message]
 
@@ -225,81 +432,78 @@ async def log_fashion_analysis_outputs(concurrent_message: Any, ctx: WorkflowCon
         for i, response in enumerate(responses):
             component_name = f"fashion_analysis_component_{i + 1}"
 
-            # Extract content from response - try multiple attributes
-            analysis_content = ""
-            if hasattr(response, 'output') and response.output:
-                analysis_content = str(response.output).strip()
-            elif hasattr(response, 'agent_run_response') and response.agent_run_response:
-                analysis_content = str(response.agent_run_response).strip()
-            elif hasattr(response, 'executor_id'):
-                analysis_content = f"Analysis completed by {response.executor_id}"
+            # Extract content from response - try multiple attributes, each looked up once
+            output = getattr(response, 'output', None)
+            agent_run_response = getattr(response, 'agent_run_response', None)
+            executor_id = getattr(response, 'executor_id', None)
+            if output:
+                # Extracted outputs are already stripped strings; str.strip() returns them as-is
+                analysis_content = output.strip() if isinstance(output, str) else str(output).strip()
+            elif agent_run_response:
+                analysis_content = str(agent_run_response).strip()
+            elif executor_id is not None:
+                analysis_content = f"Analysis completed by {executor_id}"
             else:
                 analysis_content = str(response).strip()
 
             if analysis_content:
-                # Categorize the analysis based on content keywords
-                if any(keyword in analysis_content.lower() for keyword in
-                      ["market", "trend", "consumer", "demand", "demographic"]):
-                    component_name = "market_trend_analysis"
-                elif any(keyword in analysis_content.lower() for keyword in
-                        ["design", "aesthetic", "style", "color", "fabric", "material"]):
-                    component_name = "design_evaluation"
-                elif any(keyword in analysis_content.lower() for keyword in
-                        ["production", "manufacturing", "cost", "supply", "logistics"]):
-                    component_name = "production_feasibility"
-                elif any(keyword in analysis_content.lower() for keyword in
-                        ["sustainability", "ethical", "environmental", "eco"]):
-                    component_name = "sustainability_assessment"
+                # Categorize the analysis by its author, falling back to content keywords
+                component_name = (
+                    _COMPONENT_BY_AGENT_NAME.get(executor_id)
+                    or _classify_component(analysis_content)
+                    or component_name
+                )
 
                 consolidated_analysis["components"][component_name] = {
                     "content": analysis_content,
                     "length": len(analysis_content),
-                    "agent_id": getattr(response, 'executor_id', f"agent_{i + 1}")
+                    "agent_id": executor_id if executor_id is not None else f"agent_{i + 1}"
                 }
 
-                print(f"PROCESSED: {component_name}: {len(analysis_content)} characters")
+                logger.debug("PROCESSED: %s: %d characters", component_name, len(analysis_content))
             else:
-                print(f"WARNING: No content found in response {i + 1}")
+                logger.warning("STEP 4: No content found in response %d", i + 1)
 
         # Log summary of analysis components
-        total_components = len(consolidated_analysis["components"])
-        print(f"CONSOLIDATED: {total_components} fashion analysis components")
-
-        for component_name, component_data in consolidated_analysis["components"].items():
-            print(f"  - {component_name}: {component_data['length']} chars")
+        logger.info(
+            "STEP 4: Consolidated %d fashion analysis components: %s",
+            len(consolidated_analysis["components"]), ", ".join(consolidated_analysis["components"])
+        )
 
         # Store analysis components in cache for steps 6A/6B to use
         _concept_metadata_cache["analysis_components"] = consolidated_analysis["components"]
-        print(f"STEP 4: Stored {total_components} analysis components in cache")
 
-        consolidated_json = json.dumps(consolidated_analysis, indent=2)
+        components = consolidated_analysis["components"]
+        templated_report = _try_templated_synthesis(
+            components.get("market_trend_analysis", {}).get("content", ""),
+            components.get("design_evaluation", {}).get("content", ""),
+            components.get("production_feasibility", {}).get("content", "")
+        )
+        if templated_report is not None:
+            logger.info("ROUTING: Specialist verdicts parsed - sending templated report to the approval manager")
+            await ctx.send_message(TemplatedConceptReport(content=templated_report))
+            return
 
-        print("=" * 80)
-        print("ROUTING: LOG_FASHION_ANALYSIS_OUTPUTS -> CONCEPT_REPORT_WRITER_AGENT")
-        print("=" * 80)
-        print(f"ROUTING: Sending consolidated_json type: {type(consolidated_json)}")
-        print(f"ROUTING: Consolidated JSON length: {len(consolidated_json)} characters")
-        print(f"ROUTING: Target: concept_report_writer_agent")
+        # Compact: the report writer reads the data, not the layout, and whitespace costs prompt tokens
+        consolidated_json = _dumps(consolidated_analysis)
+
+        logger.info(
+            "ROUTING: Sending %d characters of consolidated analysis to the concept report writer",
+            len(consolidated_json)
+        )
 
         # Send consolidated analysis to the report generation stage
         await ctx.send_message(consolidated_json)
-        print("ROUTING: Message sent successfully to concept report writer")
-        print("=" * 80)
 
         # Note: We keep metadata in cache for steps 5, 6A, 6B to use
         # It will be cleaned up in the final steps (6A/6B)
 
     except Exception as e:
-        error_msg = f"Failed to process fashion analysis outputs: {str(e)}"
-        print(f"STEP 4 ERROR: {error_msg}")
+        error_msg = f"Failed to process fashion analysis outputs: {e}"
+        logger.exception("STEP 4: %s", error_msg)
 
         # Send error information
-        error_data = {
-            "error": error_msg,
-            "error_type": "analysis_consolidation_error",
-            "timestamp": datetime.now().isoformat()
-        }
-        await ctx.send_message(json.dumps(error_data))
+        await ctx.send_message(_error_payload(error_msg, "analysis_consolidation_error"))
 
 
 @executor(id="concept_input_adapter")
@@ -315,17 +519,13 @@ async def adapt_concept_for_analysis(concept_data_json: str, ctx: WorkflowContex
         concept_data_json: JSON string containing extracted concept data
         ctx: Workflow context for sending adapted data
     """
-    print("=" * 80)
-    print("STEP 3: ADAPT_CONCEPT_FOR_ANALYSIS - STARTING")
-    print("=" * 80)
-    print(f"ROUTING: Received data type: {type(concept_data_json)}")
-    print(f"ROUTING: Data length: {len(str(concept_data_json))} characters")
+    logger.info("STEP 3: Adapting concept data for analysis")
 
     try:
-        concept_data = json.loads(concept_data_json)
+        concept_data = orjson.loads(concept_data_json)
 
         if "error" in concept_data:
-            print(f"WARNING: Received error from previous step: {concept_data['error']}")
+            logger.warning("STEP 3: Received error from previous step: %s", concept_data['error'])
             # Pass through error data
             await ctx.send_message(concept_data_json)
             return
@@ -358,46 +558,27 @@ async def adapt_concept_for_analysis(concept_data_json: str, ctx: WorkflowContex
                     })
 
                 # Identify market-related signals
-                market_keywords = ["target", "audience", "market", "customer", "demographic",
-                                 "price", "competitor", "trend", "season"]
-                if any(keyword in slide_text.lower() for keyword in market_keywords):
+                if _MARKET_SIGNAL_RE.search(slide_text):
                     adapted_data["market_signals"].append(slide_text)
 
                 # Identify production-related information
-                production_keywords = ["fabric", "material", "manufacturing", "cost", "supplier",
-                                     "production", "quality", "sizes", "fit"]
-                if any(keyword in slide_text.lower() for keyword in production_keywords):
+                if _PRODUCTION_NOTE_RE.search(slide_text):
                     adapted_data["production_notes"].append(slide_text)
 
         # Create comprehensive analysis prompt
-        analysis_prompt = f"""
-        ZAVA CLOTHING CONCEPT ANALYSIS REQUEST
-
-        Concept File: {adapted_data['concept_summary']['file_name']}
-        Total Slides: {adapted_data['concept_summary']['total_slides']}
-        Fashion Elements: {adapted_data['concept_summary']['concept_elements']}
-
-        Please analyze this clothing concept submission from the perspective of Zava,
-        a fashion-forward clothing company evaluating new design concepts.
-
-        CONCEPT CONTENT:
-        {json.dumps(adapted_data['design_content'], indent=2)}
-
-        Please provide comprehensive analysis covering:
-        1. Market potential and fashion trend alignment
-        2. Design innovation and aesthetic appeal
-        3. Production feasibility and cost considerations
-        4. Brand fit with Zava's positioning
-        5. Competitive differentiation opportunities
-
-        Focus on actionable insights that will help determine whether to approve
-        this concept for development.
-        """
+        analysis_prompt = _ANALYSIS_PROMPT_TEMPLATE.format(
+            file_name=adapted_data['concept_summary']['file_name'],
+            total_slides=adapted_data['concept_summary']['total_slides'],
+            concept_elements=adapted_data['concept_summary']['concept_elements'],
+            concept_content=_dumps(adapted_data['design_content'], indent=True)
+        )
 
-        print(f"SUCCESS: Adapted concept data for analysis:")
-        print(f"  - {len(adapted_data['design_content'])} slides with content")
-        print(f"  - {len(adapted_data['market_signals'])} market signals identified")
-        print(f"  - {len(adapted_data['production_notes'])} production notes found")
+        logger.info(
+            "STEP 3: Adapted %d slides with content, %d market signals, %d production notes",
+            len(adapted_data['design_content']),
+            len(adapted_data['market_signals']),
+            len(adapted_data['production_notes'])
+        )
 
         # Store concept metadata in cache for retrieval by later steps
         # (needed because concurrent workflow is a black box that can't pass metadata through)
@@ -415,31 +596,20 @@ async def adapt_concept_for_analysis(concept_data_json: str, ctx: WorkflowContex
             "analysis_prompt": analysis_prompt
         }
 
-        print("=" * 80)
-        print("ROUTING: ADAPT_CONCEPT_FOR_ANALYSIS -> CONCURRENT_FASHION_ANALYSIS")
-        print("=" * 80)
-        print(f"ROUTING: Stored concept metadata in cache with ID: {workflow_id}")
-        print(f"ROUTING: Concept: {concept_data.get('concept_file_name')} ({concept_data.get('total_slides')} slides)")
-        print(f"ROUTING: Sending data_package with workflow_id + analysis_prompt")
-        print(f"ROUTING: Analysis prompt length: {len(analysis_prompt)} characters")
-        print(f"ROUTING: Target: concurrent_fashion_analysis (ConcurrentBuilder workflow)")
+        logger.debug(
+            "ROUTING: Stored concept metadata with ID %s; sending %d character analysis prompt",
+            workflow_id, len(analysis_prompt)
+        )
 
         # Send the package to the concurrent analysis workflow
-        await ctx.send_message(json.dumps(data_package))
-        print("ROUTING: Data package sent successfully to concurrent analysis workflow")
-        print("=" * 80)
+        await ctx.send_message(_dumps(data_package))
 
     except Exception as e:
-        error_msg = f"Failed to adapt concept data: {str(e)}"
-        print(f"STEP 3 ERROR: {error_msg}")
+        error_msg = f"Failed to adapt concept data: {e}"
+        logger.exception("STEP 3: %s", error_msg)
 
         # Send error information
-        error_data = {
-            "error": error_msg,
-            "error_type": "concept_adaptation_error",
-            "timestamp": datetime.now().isoformat()
-        }
-        await ctx.send_message(json.dumps(error_data))
+        await ctx.send_message(_error_payload(error_msg, "concept_adaptation_error"))
 
 
 @executor(id="save_approved_concept_report")
@@ -451,11 +621,10 @@ async def save_approved_concept_report(approval_data: Any, ctx: WorkflowContext[
         approval_data: Data from the approval process including analysis results
         ctx: Workflow context for sending final results
     """
-    print("STEP 6A: Generating approved concept development report...")
+    logger.info("STEP 6A: Generating approved concept development report")
 
     try:
-        # Initialize the report generator
-        report_generator = ZavaFashionReportGenerator()
+        report_generator = _report_generator
 
         # Retrieve concept metadata from cache
         workflow_id = _concept_metadata_cache.get("current_workflow_id")
@@ -464,8 +633,10 @@ async def save_approved_concept_report(approval_data: Any, ctx: WorkflowContext[
         # Retrieve analysis components from cache
         analysis_components = _concept_metadata_cache.get("analysis_components", {})
 
-        print(f"STEP 6A: Retrieved concept: {concept_metadata.get('concept_file_name', 'Unknown')}")
-        print(f"STEP 6A: Retrieved {len(analysis_components)} analysis components")
+        logger.debug(
+            "STEP 6A: Retrieved concept %s with %d analysis components",
+            concept_metadata.get('concept_file_name', 'Unknown'), len(analysis_components)
+        )
 
         # Build concept_data from retrieved metadata
         concept_data = {
@@ -484,8 +655,12 @@ async def save_approved_concept_report(approval_data: Any, ctx: WorkflowContext[
             "Production analysis not available.")
         approval_feedback = str(approval_data) if approval_data else ""
 
-        # Generate the comprehensive approval report
-        report_content = report_generator.generate_approved_concept_report(
+        # Render and save the comprehensive approval report off the event loop
+        filename = await asyncio.to_thread(
+            _render_and_save_report,
+            report_generator.generate_approved_concept_report,
+            "zava_approved_concept",
+            "Concept Approval",
             concept_data=concept_data,
             market_analysis=market_analysis,
             design_analysis=design_analysis,
@@ -493,14 +668,10 @@ async def save_approved_concept_report(approval_data: Any, ctx: WorkflowContext[
             approval_feedback=approval_feedback
         )
 
-        # Save the report to file
-        filename = report_generator.save_report_to_file(
-            report_content=report_content,
-            filename_prefix="zava_approved_concept",
-            report_type="Concept Approval"
-        )
+        logger.info("STEP 6A: Approved concept report generated: %s", filename)
 
-        print(f"SUCCESS: Approved concept report generated: {filename}")
+        # Record the report path so the workflow manager can hand it to the UI
+        _concept_metadata_cache["last_report_path"] = filename
 
         # Clean up cache
         workflow_id = _concept_metadata_cache.get("current_workflow_id")
@@ -512,14 +683,13 @@ async def save_approved_concept_report(approval_data: Any, ctx: WorkflowContext[
             del _concept_metadata_cache["analysis_components"]
         if "original_filename" in _concept_metadata_cache:
             del _concept_metadata_cache["original_filename"]
-        print("STEP 6A: Cleaned up metadata cache")
 
         # Send confirmation message
         await ctx.send_message("APPROVED")
 
     except Exception as e:
-        error_msg = f"Failed to generate approved concept report: {str(e)}"
-        print(f"STEP 6A ERROR: {error_msg}")
+        error_msg = f"Failed to generate approved concept report: {e}"
+        logger.exception("STEP 6A: %s", error_msg)
         await ctx.send_message(f"ERROR: {error_msg}")
 
 
@@ -532,11 +702,10 @@ async def draft_concept_rejection_email(rejection_data: Any, ctx: WorkflowContex
         rejection_data: Data from the rejection decision including reasons
         ctx: Workflow context for sending final results
     """
-    print("STEP 6B: Generating concept rejection notification...")
+    logger.info("STEP 6B: Generating concept rejection notification")
 
     try:
-        # Initialize the report generator
-        report_generator = ZavaFashionReportGenerator()
+        report_generator = _report_generator
 
         # Retrieve concept metadata from cache
         workflow_id = _concept_metadata_cache.get("current_workflow_id")
@@ -545,8 +714,10 @@ async def draft_concept_rejection_email(rejection_data: Any, ctx: WorkflowContex
         # Retrieve analysis components from cache
         analysis_components = _concept_metadata_cache.get("analysis_components", {})
 
-        print(f"STEP 6B: Retrieved concept: {concept_metadata.get('concept_file_name', 'Unknown')}")
-        print(f"STEP 6B: Retrieved {len(analysis_components)} analysis components")
+        logger.debug(
+            "STEP 6B: Retrieved concept %s with %d analysis components",
+            concept_metadata.get('concept_file_name', 'Unknown'), len(analysis_components)
+        )
 
         # Build concept_data from retrieved metadata
         concept_data = {
@@ -575,22 +746,22 @@ async def draft_concept_rejection_email(rejection_data: Any, ctx: WorkflowContex
             "and align with current fashion trends and sustainable production practices."
         )
 
-        # Generate the rejection email
-        email_content = report_generator.generate_rejected_concept_email(
+        # Render and save the rejection email off the event loop
+        filename = await asyncio.to_thread(
+            _render_and_save_report,
+            report_generator.generate_rejected_concept_email,
+            "zava_concept_rejection",
+            "Concept Rejection",
             concept_data=concept_data,
             rejection_reasons=rejection_reasons,
             constructive_feedback=constructive_feedback,
             alternative_suggestions=alternative_suggestions
         )
 
-        # Save the email to file
-        filename = report_generator.save_report_to_file(
-            report_content=email_content,
-            filename_prefix="zava_concept_rejection",
-            report_type="Concept Rejection"
-        )
+        logger.info("STEP 6B: Rejection email generated: %s", filename)
 
-        print(f"SUCCESS: Rejection email generated: {filename}")
+        # Record the report path so the workflow manager can hand it to the UI
+        _concept_metadata_cache["last_report_path"] = filename
 
         # Clean up cache
         workflow_id = _concept_metadata_cache.get("current_workflow_id")
@@ -602,14 +773,13 @@ async def draft_concept_rejection_email(rejection_data: Any, ctx: WorkflowContex
             del _concept_metadata_cache["analysis_components"]
         if "original_filename" in _concept_metadata_cache:
             del _concept_metadata_cache["original_filename"]
-        print("STEP 6B: Cleaned up metadata cache")
 
         # Send confirmation message
         await ctx.send_message("REJECTED")
 
     except Exception as e:
-        error_msg = f"Failed to generate rejection email: {str(e)}"
-        print(f"STEP 6B ERROR: {error_msg}")
+        error_msg = f"Failed to generate rejection email: {e}"
+        logger.exception("STEP 6B: %s", error_msg)
         await ctx.send_message(f"ERROR: {error_msg}")
 
 
@@ -625,74 +795,38 @@ async def convert_report_to_approval_request(report_response: AgentExecutorRespo
         report_response: Response from the concept report writer agent
         ctx: Workflow context for sending the report content
     """
-    print("=" * 80)
-    print("STEP 5: CONVERT_REPORT_TO_APPROVAL_REQUEST - STARTING")
-    print("=" * 80)
-    print(f"ROUTING: Received report_response type: {type(report_response)}")
-    print(f"ROUTING: Report response attributes: {dir(report_response)}")
-
-    if hasattr(report_response, 'agent_run_response'):
-        print(f"ROUTING: agent_run_response type: {type(report_response.agent_run_response)}")
-
-    if hasattr(report_response, 'executor_id'):
-        print(f"ROUTING: executor_id: {report_response.executor_id}")
-
-    print("=" * 80)
+    logger.info("STEP 5: Converting executive report to an approval request")
 
     try:
-        # Extract the report content from the agent response
-        if hasattr(report_response, 'agent_run_response') and report_response.agent_run_response:
-            if hasattr(report_response.agent_run_response, 'text'):
-                report_content = report_response.agent_run_response.text
-            else:
-                report_content = str(report_response.agent_run_response)
+        # Extract the report content from the agent response; AgentRunResponse.text is already a str
+        agent_run_response = getattr(report_response, 'agent_run_response', None)
+        if agent_run_response:
+            report_text = getattr(agent_run_response, 'text', None)
+            report_content = report_text if isinstance(report_text, str) else str(agent_run_response)
         else:
             report_content = str(report_response)
 
-        print("=" * 80)
-        print("ROUTING: CONVERT_REPORT_TO_APPROVAL_REQUEST -> ZAVA_CONCEPT_APPROVAL_MANAGER")
-        print("=" * 80)
-        print(f"ROUTING: Sending report_content type: {type(report_content)}")
-        print(f"ROUTING: Report content length: {len(report_content)} characters")
-        print(f"ROUTING: Target: zava_approval_manager (ZavaConceptApprovalManager)")
-
-        print("SUCCESS: Sending report content to approval manager")
+        logger.debug("ROUTING: Sending %d character report to the approval manager", len(report_content))
         await ctx.send_message(report_content)
-        print("ROUTING: Report content sent successfully to approval manager")
-        print("=" * 80)
 
     except Exception as e:
-        print(f"ERROR: Failed to process report response: {e}")
+        logger.exception("STEP 5: Failed to process report response: %s", e)
         # Send fallback report content
-        fallback_content = f"Report processing error: {str(e)}\nFallback content: {str(report_response)}"
+        fallback_content = f"Report processing error: {e}\nFallback content: {report_response}"
         await ctx.send_message(fallback_content)
 
 
 @executor(id="approved_concept_handler")
 async def handle_approved_concept(result: str, ctx: WorkflowContext[None]) -> None:
     """Handle the final processing of an approved clothing concept."""
-    print("=" * 80)
-    print("FINAL HANDLER: handle_approved_concept called")
-    print("=" * 80)
-    print(f"FINAL HANDLER: Received result type: {type(result)}")
-    print(f"FINAL HANDLER: Result value: {result}")
-    print(f"SUCCESS: Clothing concept APPROVED for development: {result}")
-    print("FINAL HANDLER: Yielding output 'APPROVED'")
+    # Yield first so the UI sees the outcome before anything else runs
     await ctx.yield_output("APPROVED")
-    print("FINAL HANDLER: Output 'APPROVED' yielded successfully")
-    print("=" * 80)
+    logger.info("FINAL HANDLER: Clothing concept APPROVED for development: %s", result)
 
 
 @executor(id="rejected_concept_handler")
 async def handle_rejected_concept(result: str, ctx: WorkflowContext[None]) -> None:
     """Handle the final processing of a rejected clothing concept."""
-    print("=" * 80)
-    print("FINAL HANDLER: handle_rejected_concept called")
-    print("=" * 80)
-    print(f"FINAL HANDLER: Received result type: {type(result)}")
-    print(f"FINAL HANDLER: Result value: {result}")
-    print(f"REJECTED: Clothing concept REJECTED: {result}")
-    print("FINAL HANDLER: Yielding output 'REJECTED'")
+    # Yield first so the UI sees the outcome before anything else runs
     await ctx.yield_output("REJECTED")
-    print("FINAL HANDLER: Output 'REJECTED' yielded successfully")
-    print("=" * 80)
\ No newline at end of file
+    logger.info("FINAL HANDLER: Clothing concept REJECTED: %s", result)
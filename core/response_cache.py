@@ -0,0 +1,172 @@
+"""
+Response cache for Zava fashion analysis agents.
+
+Concept pitches are often resubmitted unchanged or with only formatting
+edits. This module caches agent responses keyed by the agent's model,
+instructions and whitespace-normalized prompt so repeat evaluations skip
+the model call entirely. Entries expire after a TTL so a long-running
+server doesn't keep replaying an answer the model would no longer give.
+"""
+
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from agent_framework import AgentRunResponse, ChatMessage
+
+logger = logging.getLogger(__name__)
+
+# Collapses runs of whitespace so re-indented or re-wrapped prompts share a key
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class AgentResponseCache:
+    """
+    Bounded LRU cache of agent responses keyed by agent, model, instructions and prompt text.
+
+    Entries older than ttl_seconds are treated as misses and dropped.
+    Prompts are normalized (whitespace collapsed; case is significant, since
+    brand names and SKUs can differ only by case) and hashed, so only a digest
+    of each prompt is kept in memory.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl_seconds: float = 3600.0):
+        """
+        Args:
+            max_entries: Maximum number of responses kept before evicting the oldest
+            ttl_seconds: Seconds a cached response may be reused after it was stored
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # Values are (monotonic time stored, response)
+        self._entries: "OrderedDict[str, Tuple[float, AgentRunResponse]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(agent_name: str, model: Optional[str], instructions: Optional[str], messages: Any) -> str:
+        """
+        Build the cache key for an agent run.
+
+        Args:
+            agent_name: Name of the agent the prompt is sent to
+            model: Model deployment the agent runs on
+            instructions: The agent's system instructions
+            messages: Prompt as accepted by ChatAgent.run (str, ChatMessage or a list of either)
+
+        Returns:
+            Hex digest identifying the agent configuration and normalized prompt
+        """
+        if messages is None:
+            messages = []
+        elif not isinstance(messages, list):
+            messages = [messages]
+
+        # A new deployment or prompt version must not be served answers cached under the old one
+        parts = [agent_name, f"model:{model or ''}", f"instructions:{instructions or ''}"]
+        for message in messages:
+            if isinstance(message, ChatMessage):
+                parts.append(f"{message.role}:{message.text}")
+            else:
+                parts.append(f"user:{message}")
+
+        normalized = _WHITESPACE_RE.sub(" ", "\n".join(parts)).strip()
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[AgentRunResponse]:
+        """
+        Look up a cached response and mark it as recently used.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            The cached response, or None on a miss or an expired entry
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: AgentRunResponse) -> None:
+        """
+        Store a response, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key from make_key
+            response: Agent response to reuse for identical prompts
+        """
+        self._entries[key] = (time.monotonic(), response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class CachedAgent:
+    """
+    Agent wrapper that serves repeat prompts from an AgentResponseCache.
+
+    Delegates everything except run() to the wrapped agent, so it can be
+    passed to AgentExecutor in place of the agent itself.
+    """
+
+    # One wrapper is created per agent per workflow build; slots keep it dict-free
+    __slots__ = ("_agent", "_response_cache", "_is_cacheable")
+
+    def __init__(self, agent: Any, cache: AgentResponseCache, is_cacheable: Optional[Callable[[str], bool]] = None):
+        """
+        Args:
+            agent: The chat agent to wrap
+            cache: Shared response cache
+            is_cacheable: Check a response's text must pass to be cached, e.g. that it
+                parses as a complete analysis; any non-empty response is cached if omitted
+        """
+        self._agent = agent
+        self._response_cache = cache
+        self._is_cacheable = is_cacheable
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._agent, name)
+
+    async def run(self, messages: Any = None, *, thread: Any = None, **kwargs: Any) -> AgentRunResponse:
+        """
+        Return the cached response for this prompt, or run the agent and cache the result.
+
+        Args:
+            messages: Prompt messages for the agent
+            thread: Conversation thread passed through to the agent on a miss
+            **kwargs: Additional run options passed through to the agent
+
+        Returns:
+            The agent response
+        """
+        chat_options = getattr(self._agent, "chat_options", None)
+        model = (
+            kwargs.get("model")
+            or getattr(chat_options, "model_id", None)
+            or getattr(getattr(self._agent, "chat_client", None), "model_id", None)
+        )
+        key = self._response_cache.make_key(
+            self._agent.name or "", model, getattr(chat_options, "instructions", None), messages
+        )
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            logger.debug("CACHE: Reusing %s response for a previously analyzed concept", self._agent.name)
+            return cached
+
+        response = await self._agent.run(messages, thread=thread, **kwargs)
+        # Don't cache empty, refused or truncated responses so a transient failure isn't replayed
+        text = response.text
+        if text and (self._is_cacheable is None or self._is_cacheable(text)):
+            self._response_cache.set(key, response)
+        return response
+
+
+# Shared across workflow runs; agents are rebuilt per analysis but cached responses persist
+agent_response_cache = AgentResponseCache()
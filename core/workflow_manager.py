@@ -14,6 +14,7 @@ from typing import Any, Dict, Optional, List, Callable
 from dotenv import load_dotenv
 
 from agent_framework import (
+    AgentRunUpdateEvent,
     ChatMessage,
     Executor,
     Role,
@@ -28,6 +29,7 @@ from agent_framework import (
 )
 
 # Import our modular components
+from core import executors
 from core.executors import (
     process_clothing_concept_pitch,
     log_fashion_analysis_outputs,
@@ -37,13 +39,13 @@ from core.executors import (
     save_approved_concept_report,
     draft_concept_rejection_email,
     handle_approved_concept,
-    handle_rejected_concept
+    handle_rejected_concept,
+    needs_report_writer,
+    is_templated_report
 )
 from core.agents import (
-    create_fashion_research_agent,
-    create_design_evaluation_agent,
-    create_production_feasibility_agent,
     create_concurrent_fashion_analysis_workflow,
+    create_unified_fashion_analysis_workflow,
     create_concept_report_writer_agent
 )
 from core.approval import (
@@ -66,7 +68,8 @@ class ZavaConceptWorkflowManager:
                  progress_callback: Optional[Callable] = None,
                  output_callback: Optional[Callable] = None,
                  approval_callback: Optional[Callable] = None,
-                 error_callback: Optional[Callable] = None):
+                 error_callback: Optional[Callable] = None,
+                 stream_callback: Optional[Callable] = None):
         """
         Initialize the Zava concept workflow manager.
 
@@ -75,19 +78,26 @@ class ZavaConceptWorkflowManager:
             output_callback: Called with (source, content, output_type)
             approval_callback: Called with (question, context) for human decisions
             error_callback: Called with (error_message) for error handling
+            stream_callback: Called with (source, text_delta) as streaming agents generate text
         """
         # Store UI callback functions
         self.progress_callback = progress_callback
         self.output_callback = output_callback
         self.approval_callback = approval_callback
         self.error_callback = error_callback
+        self.stream_callback = stream_callback
 
         # Workflow components
         self.workflow = None
         self.chat_clients = []
+        self.project_client = None
+        self._warmup_task: Optional[asyncio.Task] = None
         self.approval_response = None
         self.approval_event = None
 
+        # Path of the report or rejection email produced by the last run
+        self.last_report_path: Optional[str] = None
+
         # Force fresh workflow builds to avoid caching issues
         self._force_rebuild = True
 
@@ -132,15 +142,25 @@ class ZavaConceptWorkflowManager:
         """Execute workflow with retry logic for rate limiting."""
         for attempt in range(max_retries):
             try:
-                events = [event async for event in workflow_stream]
+                events = []
+                streamed_executors = set()
+                async for event in workflow_stream:
+                    if isinstance(event, AgentRunUpdateEvent):
+                        # Forward streamed agent text as soon as it is generated; only the
+                        # first update per executor is kept for progress tracking
+                        await self._stream_output(event.executor_id, event.data.text)
+                        if event.executor_id in streamed_executors:
+                            continue
+                        streamed_executors.add(event.executor_id)
+                    events.append(event)
                 return events
 
             except Exception as e:
                 # Check if this is a rate limit error
-                error_str = str(e)
-                if "rate limit" in error_str.lower():
+                error_str = str(e).lower()
+                if "rate limit" in error_str:
                     # Extract wait time from error message
-                    wait_match = re.search(r'try again in (\d+) seconds', error_str.lower())
+                    wait_match = re.search(r'try again in (\d+) seconds', error_str)
                     wait_seconds = int(wait_match.group(1)) if wait_match else 30
 
                     if attempt < max_retries - 1:  # Not the last attempt
@@ -182,11 +202,14 @@ class ZavaConceptWorkflowManager:
 
             # Create fashion analysis agents
             await self._update_progress("Creating fashion analysis agents...", 15)
-            concept_report_writer = create_concept_report_writer_agent(self.chat_clients)
+            concept_report_writer = create_concept_report_writer_agent(self.chat_clients, stream=True)
 
-            # Create concurrent fashion analysis workflow
+            # Create concurrent fashion analysis workflow (or the single-call unified variant)
             await self._update_progress("Creating concurrent fashion analysis workflow...", 20)
-            concurrent_analysis_workflow = await create_concurrent_fashion_analysis_workflow(self.chat_clients)
+            if os.getenv("UNIFIED_ANALYSIS", "false").lower() == "true":
+                concurrent_analysis_workflow = await create_unified_fashion_analysis_workflow(self.chat_clients)
+            else:
+                concurrent_analysis_workflow = await create_concurrent_fashion_analysis_workflow(self.chat_clients)
 
             # Wrap concurrent workflow in WorkflowExecutor (REQUIRED pattern)
             await self._update_progress("Setting up concurrent subworkflow executor...", 22)
@@ -206,7 +229,8 @@ class ZavaConceptWorkflowManager:
                 .add_edge(adapt_concept_for_analysis, extract_analysis_prompt)\
                 .add_edge(extract_analysis_prompt, concurrent_analysis_subworkflow)\
                 .add_edge(concurrent_analysis_subworkflow, log_fashion_analysis_outputs)\
-                .add_edge(log_fashion_analysis_outputs, concept_report_writer)\
+                .add_edge(log_fashion_analysis_outputs, concept_report_writer, condition=needs_report_writer)\
+                .add_edge(log_fashion_analysis_outputs, approval_manager, condition=is_templated_report)\
                 .add_edge(concept_report_writer, convert_report_to_approval_request)\
                 .add_edge(convert_report_to_approval_request, approval_manager)\
                 .add_edge(approval_manager, human_approver)\
@@ -243,10 +267,11 @@ class ZavaConceptWorkflowManager:
         Returns:
             Final workflow result ("APPROVED" or "REJECTED")
         """
+        self.last_report_path = None
+
         try:
             # Store original filename in executors cache if provided
             if original_filename:
-                from core import executors
                 executors._concept_metadata_cache["original_filename"] = original_filename
             # Always rebuild workflow to ensure fresh agents with updated instructions
             success = await self.build_concept_evaluation_workflow()
@@ -419,6 +444,9 @@ class ZavaConceptWorkflowManager:
                 elif not human_requests and not workflow_idle:
                     print("WORKFLOW: No human requests in this iteration, workflow continuing...")
 
+            # Pick up the report path recorded by the final save executor
+            self.last_report_path = executors._concept_metadata_cache.pop("last_report_path", None)
+
             return workflow_output if workflow_output else "UNKNOWN"
 
         except Exception as e:
@@ -471,6 +499,7 @@ class ZavaConceptWorkflowManager:
 
         try:
             from agent_framework_azure_ai import AzureAIAgentClient
+            from azure.ai.projects.aio import AIProjectClient
             from azure.identity.aio import AzureCliCredential
 
             await self._add_output("System", f"Initializing Azure AI Agent clients with endpoint and model: {model_deployment_name}", "info")
@@ -478,26 +507,30 @@ class ZavaConceptWorkflowManager:
             # Create Azure CLI credential for authentication
             credential = AzureCliCredential()
 
-            # Initialize multiple Azure AI Agent clients to avoid caching
+            # One project client (and so one HTTP connection pool) shared by every agent client
+            self.project_client = AIProjectClient(endpoint=project_endpoint, credential=credential)
+
+            # Initialize multiple Azure AI Agent clients to avoid caching; each client
+            # pins the service-side agent it creates, so agents can't share one
             client1 = AzureAIAgentClient(
-                project_endpoint=project_endpoint,
-                model_deployment_name=model_deployment_name,
-                async_credential=credential
+                project_client=self.project_client,
+                model_deployment_name=model_deployment_name
             )
             client2 = AzureAIAgentClient(
-                project_endpoint=project_endpoint,
-                model_deployment_name=model_deployment_name,
-                async_credential=credential
+                project_client=self.project_client,
+                model_deployment_name=model_deployment_name
             )
             client3 = AzureAIAgentClient(
-                project_endpoint=project_endpoint,
-                model_deployment_name=model_deployment_name,
-                async_credential=credential
+                project_client=self.project_client,
+                model_deployment_name=model_deployment_name
             )
 
             # Use separate clients for each agent to ensure fresh instructions
             self.chat_clients = [client1, client2, client3]
 
+            # Open the connection while the rest of the workflow is built and the pitch is parsed
+            self._warmup_task = asyncio.create_task(self._warm_up_project_client())
+
             await self._add_output("System", "Fresh AI chat clients initialized successfully", "info")
 
         except Exception as e:
@@ -512,6 +545,20 @@ class ZavaConceptWorkflowManager:
             await self._add_output("System", error_msg, "error")
             raise RuntimeError(error_msg)
 
+    async def _warm_up_project_client(self) -> None:
+        """
+        Make a cheap request on the shared project client to warm its connection.
+
+        Listing a single agent fetches the Azure CLI token and completes the TLS
+        handshake, so the first agent run doesn't pay for either. No model call
+        is made. Failures are ignored; the agents connect on demand as before.
+        """
+        try:
+            async for _ in self.project_client.agents.list_agents(limit=1):
+                break
+        except Exception as e:
+            print(f"Connection warmup skipped: {e}")
+
     async def _configure_telemetry(self) -> None:
         """Configure OpenTelemetry tracing for workflow monitoring."""
         try:
@@ -581,6 +628,16 @@ class ZavaConceptWorkflowManager:
             else:
                 self.output_callback(source, content, output_type)
 
+    async def _stream_output(self, executor_id: str, text: str) -> None:
+        """Forward incremental agent text through UI callback."""
+        if self.stream_callback and text:
+            # Label the stream with the workflow step the executor belongs to
+            source = self.workflow_steps.get(executor_id, (executor_id,))[0]
+            if asyncio.iscoroutinefunction(self.stream_callback):
+                await self.stream_callback(source, text)
+            else:
+                self.stream_callback(source, text)
+
     async def _handle_error(self, error: str) -> None:
         """Handle workflow errors through UI callback."""
         if self.error_callback:
@@ -645,5 +702,15 @@ class ZavaConceptWorkflowManager:
                         await client.close()
                 except Exception as e:
                     await self._add_output("System", f"Client cleanup warning: {str(e)}", "warning")
+            self.chat_clients = []
+
+            if self._warmup_task is not None:
+                self._warmup_task.cancel()
+                self._warmup_task = None
+
+            # Agent clients don't close a project client they were given, so close the shared one here
+            if self.project_client is not None:
+                await self.project_client.close()
+                self.project_client = None
         except Exception:
             pass  # Ignore cleanup errors
\ No newline at end of file
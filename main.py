@@ -24,19 +24,23 @@ def start_web_ui(port: int = 8000):
     """
     try:
         import uvicorn
-        from backend import app
+        from backend import app, configure_logging
 
         print("Starting Zava Clothing Concept Analysis Web Interface...")
         print(f"Access the interface at: http://localhost:{port}")
         print("Real-time updates available via WebSocket")
         print("Press Ctrl+C to stop the server")
 
-        uvicorn.run(
-            app,
-            host="0.0.0.0",
-            port=port,
-            log_level="info"
-        )
+        log_listener = configure_logging()
+        try:
+            uvicorn.run(
+                app,
+                host="0.0.0.0",
+                port=port,
+                log_level="info"
+            )
+        finally:
+            log_listener.stop()
 
     except ImportError:
         print("ERROR: FastAPI dependencies not available.")
@@ -5,11 +5,18 @@ This module handles the extraction of information from PowerPoint pitch decks
 containing new clothing concept proposals for Zava.
 """
 
-import json
+import re
+import orjson
 from typing import Dict, List, Any
 from pathlib import Path
 from pptx import Presentation
 
+# Keywords (matched anywhere in the text) that mark a text block as a fashion concept element
+_CONCEPT_ELEMENT_RE = re.compile(
+    "fabric|material|design|collection|style|trend|season|color|pattern|fit|size|target audience|market",
+    re.IGNORECASE
+)
+
 
 def extract_clothing_concept_data(file_path: str) -> str:
     """
@@ -30,10 +37,12 @@ def extract_clothing_concept_data(file_path: str) -> str:
     # Validate file exists and is a PowerPoint file
     file_path = Path(file_path)
     if not file_path.exists():
-        return json.dumps({"error": f"Clothing concept file not found: {file_path}"})
+        return orjson.dumps({"error": f"Clothing concept file not found: {file_path}"}).decode()
 
     if not file_path.suffix.lower() == '.pptx':
-        return json.dumps({"error": "File must be a .pptx PowerPoint file containing clothing concept pitch"})
+        return orjson.dumps(
+            {"error": "File must be a .pptx PowerPoint file containing clothing concept pitch"}
+        ).decode()
 
     try:
         # Load the PowerPoint presentation
@@ -57,14 +66,13 @@ def extract_clothing_concept_data(file_path: str) -> str:
 
             # Extract text from all shapes in the slide
             for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text.strip():
-                    text = shape.text.strip()
+                # shape.text is rebuilt from the text frame on every access, so read it once
+                text = getattr(shape, "text", "").strip()
+                if text:
                     slide_content["text_content"].append(text)
 
                     # Identify potential fashion/clothing concept elements
-                    if any(keyword in text.lower() for keyword in
-                          ["fabric", "material", "design", "collection", "style", "trend", "season",
-                           "color", "pattern", "fit", "size", "target audience", "market"]):
+                    if _CONCEPT_ELEMENT_RE.search(text):
                         slide_content["concept_elements"].append(text)
 
             # Add slide to extracted data
@@ -80,13 +88,14 @@ def extract_clothing_concept_data(file_path: str) -> str:
             "has_design_content": len(all_concept_elements) > 0
         }
 
-        return json.dumps(extracted_data, indent=2)
+        # Compact: the only consumer is the parser executor, which loads it straight back
+        return orjson.dumps(extracted_data).decode()
 
     except Exception as e:
-        return json.dumps({
+        return orjson.dumps({
             "error": f"Error processing clothing concept file: {str(e)}",
             "error_type": "parsing_error"
-        })
+        }).decode()
 
 
 def validate_clothing_concept_content(extracted_data_json: str) -> Dict[str, Any]:
@@ -100,7 +109,7 @@ def validate_clothing_concept_content(extracted_data_json: str) -> Dict[str, Any
         Dictionary with validation results and recommendations
     """
     try:
-        data = json.loads(extracted_data_json)
+        data = orjson.loads(extracted_data_json)
 
         if "error" in data:
             return {
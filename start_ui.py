@@ -14,7 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 try:
     import uvicorn
-    from backend import app
+    from backend import app, configure_logging
 
     def main():
         """Start the Zava concept analysis web interface."""
@@ -27,13 +27,17 @@ try:
         print("=" * 50)
 
         # Start the FastAPI server
-        uvicorn.run(
-            app,
-            host="127.0.0.1",  # Localhost only for security
-            port=8000,
-            log_level="info",
-            reload=False  # Set to True for development
-        )
+        log_listener = configure_logging()
+        try:
+            uvicorn.run(
+                app,
+                host="127.0.0.1",  # Localhost only for security
+                port=8000,
+                log_level="info",
+                reload=False  # Set to True for development
+            )
+        finally:
+            log_listener.stop()
 
     if __name__ == "__main__":
         main()
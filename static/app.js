@@ -8,6 +8,9 @@ analyze new design submissions through AI-powered analysis.
 
 const { useState, useEffect, useRef } = React;
 
+// Shared decoder for binary WebSocket frames
+const textDecoder = new TextDecoder();
+
 /**
  * Main application component for Zava Clothing Concept Analyzer
  *
@@ -62,6 +65,8 @@ function ZavaConceptAnalyzer() {
 
         try {
             websocketRef.current = new WebSocket(wsUrl);
+            // The server sends UTF-8 JSON as binary frames
+            websocketRef.current.binaryType = 'arraybuffer';
 
             websocketRef.current.onopen = () => {
                 console.log('🔗 WebSocket connected to Zava analysis system');
@@ -69,7 +74,7 @@ function ZavaConceptAnalyzer() {
             };
 
             websocketRef.current.onmessage = (event) => {
-                handleWebSocketMessage(JSON.parse(event.data));
+                handleWebSocketMessage(JSON.parse(textDecoder.decode(event.data)));
             };
 
             websocketRef.current.onclose = () => {
@@ -101,10 +106,19 @@ function ZavaConceptAnalyzer() {
     const handleWebSocketMessage = (message) => {
         switch (message.type) {
             case 'status_update':
-            case 'progress_update':
                 setAnalysisStatus(message.status);
                 break;
 
+            case 'progress_update':
+                // Incremental progress: only the new step is sent
+                setAnalysisStatus(prev => ({
+                    ...prev,
+                    progress: message.step_info.progress,
+                    current_step: message.step_info.name,
+                    steps: [...prev.steps, message.step_info]
+                }));
+                break;
+
             case 'output_added':
                 // Real-time analysis outputs (agent results, system messages, etc.)
                 setAnalysisStatus(prev => ({
@@ -113,6 +127,29 @@ function ZavaConceptAnalyzer() {
                 }));
                 break;
 
+            case 'output_delta':
+                // Streamed agent text: extend the live entry from the same source, or start one
+                setAnalysisStatus(prev => {
+                    const last = prev.outputs[prev.outputs.length - 1];
+                    if (last && last.streaming && last.source === message.source) {
+                        return {
+                            ...prev,
+                            outputs: [...prev.outputs.slice(0, -1), { ...last, content: last.content + message.delta }]
+                        };
+                    }
+                    return {
+                        ...prev,
+                        outputs: [...prev.outputs, {
+                            source: message.source,
+                            content: message.delta,
+                            type: 'text',
+                            timestamp: new Date().toISOString(),
+                            streaming: true
+                        }]
+                    };
+                });
+                break;
+
             case 'approval_request':
                 // Human approval needed for concept decision
                 setAnalysisStatus(prev => ({
@@ -129,6 +166,7 @@ function ZavaConceptAnalyzer() {
             case 'workflow_completed':
                 // Analysis complete with final results
                 setIsAnalyzing(false);
+                clearUploadedFile();
                 setFinalResults({
                     result: message.result,
                     document: message.finalDocument,
@@ -141,6 +179,11 @@ function ZavaConceptAnalyzer() {
                 }));
                 break;
 
+            case 'batch':
+                // Coalesced progress/output deltas, applied in order
+                message.messages.forEach(handleWebSocketMessage);
+                break;
+
             case 'error':
                 // Handle workflow errors
                 console.error('🚨 Analysis error:', message.error);
@@ -150,6 +193,7 @@ function ZavaConceptAnalyzer() {
                     error: message.error
                 }));
                 setIsAnalyzing(false);
+                clearUploadedFile();
                 break;
 
             default:
@@ -159,6 +203,18 @@ function ZavaConceptAnalyzer() {
 
     // ===== FILE UPLOAD HANDLING =====
 
+    /**
+     * Forget the uploaded concept once its analysis has finished or failed.
+     * The server deletes the upload at that point, so the deck must be uploaded
+     * again (the input is reset so re-selecting the same file still fires onChange).
+     */
+    const clearUploadedFile = () => {
+        setUploadedFile(null);
+        if (fileInputRef.current) {
+            fileInputRef.current.value = '';
+        }
+    };
+
     /**
      * Handle clothing concept file upload
      * Validates file format and uploads to server
@@ -191,7 +247,7 @@ function ZavaConceptAnalyzer() {
             setUploadedFile({
                 name: file.name,
                 size: file.size,
-                tempPath: result.temp_path
+                uploadId: result.upload_id
             });
 
             console.log('Concept file uploaded successfully:', result);
@@ -216,7 +272,7 @@ function ZavaConceptAnalyzer() {
             setFinalResults(null);
             setApprovalFeedback('');
 
-            const response = await fetch(`/start-analysis/${encodeURIComponent(uploadedFile.tempPath)}`, {
+            const response = await fetch(`/start-analysis/${uploadedFile.uploadId}`, {
                 method: 'POST'
             });
 